@@ -1,11 +1,30 @@
 from __future__ import annotations
 
+import os
+import sys
 from datetime import datetime
 from airflow import DAG
 from airflow.operators.bash import BashOperator
+from airflow.operators.python import PythonOperator
 
 DEFAULT_ARGS = {"owner": "alekya", "retries": 0}
 
+SCRIPTS_DIR = "/opt/airflow/scripts"
+
+
+def run_postgres_to_snowflake():
+    """
+    Run the Postgres -> Snowflake loader in-process instead of forking a new
+    interpreter: psycopg2/snowflake connections come from the worker itself
+    and failures surface as real tracebacks in the task log.
+    """
+    os.chdir("/opt/airflow")  # loader resolves config/ and data/ relative to cwd
+    if SCRIPTS_DIR not in sys.path:
+        sys.path.insert(0, SCRIPTS_DIR)
+    from postgres_to_snowflake import main as load_main
+
+    load_main()
+
 with DAG(
     dag_id="hotel_analytics_pipeline",
     default_args=DEFAULT_ARGS,
@@ -15,14 +34,10 @@ with DAG(
     tags=["hotel", "portfolio"],
 ) as dag:
 
-    # 1) Run your Python loader (Postgres -> Snowflake)
-    load_to_snowflake = BashOperator(
+    # 1) Run your Python loader (Postgres -> Snowflake) in-process
+    load_to_snowflake = PythonOperator(
         task_id="load_postgres_to_snowflake",
-        bash_command="""
-        set -e
-        cd /opt/airflow
-        python /opt/airflow/scripts/postgres_to_snowflake.py
-        """,
+        python_callable=run_postgres_to_snowflake,
     )
 
     # 2) Run dbt
@@ -36,13 +36,20 @@
 from __future__ import annotations
 
 import csv
+import heapq
+import itertools
+import os
 import random
-import uuid
+import re
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
 
+import numpy as np
 import psycopg2
 from faker import Faker
 
@@ -72,6 +79,47 @@ PG = PostgresCreds(
 OUT_DIR = Path("scripts/data/faker")  # change to "data/faker" if you want
 SEED = 42
 
+# Batched RNG for the bulk draws (locations, offsets, ...); per-row random.*
+# calls stay only where values must react to row state.
+_NP_RNG = np.random.default_rng(SEED)
+
+# Scalar draws in the per-row closures pull from a preallocated block of
+# uniforms refilled from _NP_RNG, amortizing the C-call overhead over 64k
+# draws instead of paying CPython's random module dispatch per call.
+_RAND_BLOCK = 1 << 16
+_RAND_BUF = np.empty(0)
+_RAND_I = 0
+
+
+def _reset_rand_buffer() -> None:
+    """Discard buffered uniforms (after reseeding _NP_RNG in a worker)."""
+    global _RAND_BUF, _RAND_I
+    _RAND_BUF = np.empty(0)
+    _RAND_I = 0
+
+
+def _rand() -> float:
+    global _RAND_BUF, _RAND_I
+    i = _RAND_I
+    if i >= len(_RAND_BUF):
+        _RAND_BUF = _NP_RNG.random(_RAND_BLOCK)
+        i = 0
+    _RAND_I = i + 1
+    return float(_RAND_BUF[i])
+
+
+def _rand_int(lo: int, hi: int) -> int:
+    """Inclusive-range integer draw from the buffered uniform stream."""
+    return lo + int(_rand() * (hi - lo + 1))
+
+
+def _rand_uniform(lo: float, hi: float) -> float:
+    return lo + _rand() * (hi - lo)
+
+
+def _rand_choice(seq):
+    return seq[int(_rand() * len(seq))]
+
 
 # -------------------------
 # MEANINGFUL DIMENSIONS
@@ -79,23 +127,31 @@ SEED = 42
 # Faker's city/state are independent draws, which creates nonsense combos.
 # We keep a small, realistic location pool and sample consistently per-row.
 
-LOCATION_POOL = [
+class Loc(NamedTuple):
+    city: str
+    state: str
+    country: str
+    postal_prefix: str
+    timezone: str
+
+
+LOCATION_POOL: Tuple[Loc, ...] = (
     # US (mix of timezones)
-    {"city": "Boston", "state": "MA", "country": "US", "postal_prefix": "02", "timezone": "America/New_York"},
-    {"city": "New York", "state": "NY", "country": "US", "postal_prefix": "10", "timezone": "America/New_York"},
-    {"city": "Chicago", "state": "IL", "country": "US", "postal_prefix": "60", "timezone": "America/Chicago"},
-    {"city": "Austin", "state": "TX", "country": "US", "postal_prefix": "78", "timezone": "America/Chicago"},
-    {"city": "Denver", "state": "CO", "country": "US", "postal_prefix": "80", "timezone": "America/Denver"},
-    {"city": "Seattle", "state": "WA", "country": "US", "postal_prefix": "98", "timezone": "America/Los_Angeles"},
-    {"city": "San Francisco", "state": "CA", "country": "US", "postal_prefix": "94", "timezone": "America/Los_Angeles"},
-    {"city": "San Jose", "state": "CA", "country": "US", "postal_prefix": "95", "timezone": "America/Los_Angeles"},
-    {"city": "Miami", "state": "FL", "country": "US", "postal_prefix": "33", "timezone": "America/New_York"},
+    Loc("Boston", "MA", "US", "02", "America/New_York"),
+    Loc("New York", "NY", "US", "10", "America/New_York"),
+    Loc("Chicago", "IL", "US", "60", "America/Chicago"),
+    Loc("Austin", "TX", "US", "78", "America/Chicago"),
+    Loc("Denver", "CO", "US", "80", "America/Denver"),
+    Loc("Seattle", "WA", "US", "98", "America/Los_Angeles"),
+    Loc("San Francisco", "CA", "US", "94", "America/Los_Angeles"),
+    Loc("San Jose", "CA", "US", "95", "America/Los_Angeles"),
+    Loc("Miami", "FL", "US", "33", "America/New_York"),
     # India (for variety)
-    {"city": "Bengaluru", "state": "KA", "country": "IN", "postal_prefix": "560", "timezone": "Asia/Kolkata"},
-    {"city": "Hyderabad", "state": "TS", "country": "IN", "postal_prefix": "500", "timezone": "Asia/Kolkata"},
-    {"city": "Mumbai", "state": "MH", "country": "IN", "postal_prefix": "400", "timezone": "Asia/Kolkata"},
-    {"city": "Chennai", "state": "TN", "country": "IN", "postal_prefix": "600", "timezone": "Asia/Kolkata"},
-]
+    Loc("Bengaluru", "KA", "IN", "560", "Asia/Kolkata"),
+    Loc("Hyderabad", "TS", "IN", "500", "Asia/Kolkata"),
+    Loc("Mumbai", "MH", "IN", "400", "Asia/Kolkata"),
+    Loc("Chennai", "TN", "IN", "600", "Asia/Kolkata"),
+)
 
 HOTEL_BRANDS = [
     "Marriott", "Hilton", "Hyatt", "Westin", "Sheraton", "Ibis", "Novotel", "Taj", "Oberoi", "Radisson"
@@ -106,28 +162,119 @@ ROOM_TYPE_NAMES = [
     "Studio", "Junior Suite", "Executive Suite", "Family Suite"
 ]
 
-# Per-row cache so city/state/country/timezone stay consistent within a generated row.
-_ROW_LOCATION: dict[tuple[str, int], dict] = {}
+# Per-table location columns (SoA) so city/state/country/timezone stay
+# consistent within a generated row without one cached dict per row.
+_LOC_DTYPE = np.dtype(
+    [
+        ("city", "U16"),
+        ("state", "U2"),
+        ("country", "U2"),
+        ("postal_code", "U8"),
+        ("street1", "U48"),
+        ("street2", "U12"),
+        ("timezone", "U24"),
+    ]
+)
 
+_POOL_CITY = np.array([l.city for l in LOCATION_POOL])
+_POOL_STATE = np.array([l.state for l in LOCATION_POOL])
+_POOL_COUNTRY = np.array([l.country for l in LOCATION_POOL])
+_POOL_PFX = np.array([l.postal_prefix for l in LOCATION_POOL])
+_POOL_TZ = np.array([l.timezone for l in LOCATION_POOL])
+# Postal suffix width is a property of the pool entry (US: 2+3 digits,
+# IN: 3+3, anything else 4), decided once at import instead of per row.
+_POOL_POSTAL_DIGITS = np.array(
+    [3 if l.country == "US" or len(l.postal_prefix) == 3 else 4 for l in LOCATION_POOL]
+)
+
+_ROW_LOCATION: Dict[str, np.ndarray] = {}
+# Rows past the precomputed range (uniqueness retries) still need stable locations.
+_ROW_LOCATION_OVERFLOW: Dict[Tuple[str, int], Any] = {}
+
+
+def _build_location_block(fake: Faker, n: int) -> np.ndarray:
+    pool_idx = _NP_RNG.integers(0, len(LOCATION_POOL), size=n)
+    postal_suffix = _NP_RNG.integers(0, 10000, size=n)
+    house_no = _NP_RNG.integers(10, 10000, size=n)
+    unit_kind = _NP_RNG.integers(0, 3, size=n)  # 0=no unit, 1=Apt, 2=Suite
+    apt_no = _NP_RNG.integers(1, 1000, size=n)
+    suite_no = _NP_RNG.integers(100, 2000, size=n)
+
+    # Faker is scalar-only, so mint a small pool of street names once and
+    # sample indices instead of calling fake.street_name() per row.
+    street_pool = np.array([fake.street_name() for _ in range(min(n, 512))])
+    street_idx = _NP_RNG.integers(0, len(street_pool), size=n)
+
+    arr = np.empty(n, dtype=_LOC_DTYPE)
+    arr["city"] = _POOL_CITY[pool_idx]
+    arr["state"] = _POOL_STATE[pool_idx]
+    arr["country"] = _POOL_COUNTRY[pool_idx]
+    arr["timezone"] = _POOL_TZ[pool_idx]
+    digits = _POOL_POSTAL_DIGITS[pool_idx]
+    suffix3 = np.char.zfill((postal_suffix % 1000).astype("U3"), 3)
+    suffix4 = np.char.zfill(postal_suffix.astype("U4"), 4)
+    arr["postal_code"] = np.char.add(_POOL_PFX[pool_idx], np.where(digits == 3, suffix3, suffix4))
+    arr["street1"] = np.char.add(np.char.add(house_no.astype("U4"), " "), street_pool[street_idx])
+    unit = np.where(
+        unit_kind == 1,
+        np.char.add("Apt ", apt_no.astype("U4")),
+        np.char.add("Suite ", suite_no.astype("U4")),
+    )
+    arr["street2"] = np.where(unit_kind == 0, "", unit)
+    return arr
+
+
+def precompute_row_locations(fake: Faker, table: str, n_rows: int) -> None:
+    """
+    Fill _ROW_LOCATION for a whole table up front with batched NumPy draws,
+    so get_row_location() in the row loop is a pure indexed read instead of
+    4-5 scalar random.* calls plus a Faker call per row.
+    """
+    if n_rows <= 0:
+        return
+    _ROW_LOCATION[table.lower()] = _build_location_block(fake, n_rows)
 
-def get_row_location(fake, table: str, row_idx: int) -> dict:
-    key = (table.lower(), row_idx)
-    loc = _ROW_LOCATION.get(key)
+
+def release_row_locations(table: str) -> None:
+    """
+    Location consistency is intra-row only; once a table's CSV is written
+    nothing reads its block again, so drop it instead of retaining every
+    table's locations for the whole process lifetime.
+    """
+    _ROW_LOCATION.pop(table.lower(), None)
+    _ROW_LOCATION_OVERFLOW.clear()
+
+
+def get_row_location(fake, table: str, row_idx: int):
+    tl = table.lower()
+    arr = _ROW_LOCATION.get(tl)
+    if arr is not None and 1 <= row_idx <= len(arr):
+        return arr[row_idx - 1]
+    key = (tl, row_idx)
+    loc = _ROW_LOCATION_OVERFLOW.get(key)
     if loc is None:
-        loc = dict(random.choice(LOCATION_POOL))
-        # derive a plausible postal code
-        pfx = loc.get("postal_prefix", "")
-        if loc["country"] == "US":
-            loc["postal_code"] = f"{pfx}{random.randint(0, 999):03d}"
-        else:  # IN
-            loc["postal_code"] = f"{pfx}{random.randint(0, 999):03d}" if len(pfx) == 3 else f"{pfx}{random.randint(0, 9999):04d}"
-        # plausible address lines
-        loc["street1"] = f"{random.randint(10, 9999)} {fake.street_name()}"
-        loc["street2"] = random.choice([None, f"Apt {random.randint(1, 999)}", f"Suite {random.randint(100, 1999)}"])
-        _ROW_LOCATION[key] = loc
+        loc = _build_location_block(fake, 1)[0]
+        _ROW_LOCATION_OVERFLOW[key] = loc
     return loc
 TRUNCATE_FIRST = True
 
+# Drop secondary (non-constraint) indexes and skip FK trigger firing while the
+# bulk COPY runs, then rebuild. Saves per-row B-tree maintenance on the big
+# tables; the generator only emits FK-valid rows, so skipping the triggers is safe.
+DROP_INDEXES_DURING_LOAD = True
+
+# Tables in the same FK level have no dependency path between them, so their
+# generate+COPY pipelines can run on separate Postgres backends concurrently.
+PARALLEL_WORKERS = 4
+
+# Seed data is throwaway until the load finishes, so skip WAL for it: flip the
+# targets to UNLOGGED for the duration of the seed and re-log them at the end.
+STAGING_UNLOGGED = True
+
+# Session-scope bulk-load GUCs (synchronous_commit, wal_writer_delay, ...).
+# A crash can lose the last few seconds of commits — fine for a seeder.
+AGGRESSIVE_TUNING = True
+
 # Override row counts (applied only if table exists)
 ROW_COUNTS_OVERRIDE = {
     "booking": 70_000,
@@ -160,6 +307,16 @@ class ColumnInfo:
     char_max_len: Optional[int]
     numeric_precision: Optional[int]
     numeric_scale: Optional[int]
+    # Lowercased views, computed once at construction; the generators consult
+    # these in per-row paths where repeated str.lower() calls add up.
+    column_lc: str = ""
+    data_type_lc: str = ""
+    udt_name_lc: str = ""
+
+    def __post_init__(self):
+        object.__setattr__(self, "column_lc", self.column.lower())
+        object.__setattr__(self, "data_type_lc", self.data_type.lower())
+        object.__setattr__(self, "udt_name_lc", self.udt_name.lower())
 
 
 @dataclass(frozen=True)
@@ -179,37 +336,27 @@ class PrimaryKey:
 # -------------------------
 # Introspection
 # -------------------------
-def fetch_tables(conn, schema: str) -> List[str]:
-    with conn.cursor() as cur:
-        cur.execute(
-            """
-            SELECT table_name
-            FROM information_schema.tables
-            WHERE table_schema = %s AND table_type='BASE TABLE'
-            ORDER BY table_name
-            """,
-            (schema,),
-        )
-        return [r[0] for r in cur.fetchall()]
-
-
 def fetch_columns(conn, schema: str) -> Dict[str, List[ColumnInfo]]:
     out: Dict[str, List[ColumnInfo]] = {}
     with conn.cursor() as cur:
         cur.execute(
             """
             SELECT
-              table_name,
-              column_name,
-              data_type,
-              udt_name,
-              is_nullable,
-              character_maximum_length,
-              numeric_precision,
-              numeric_scale
-            FROM information_schema.columns
-            WHERE table_schema = %s
-            ORDER BY table_name, ordinal_position
+              c.table_name,
+              c.column_name,
+              c.data_type,
+              c.udt_name,
+              c.is_nullable,
+              c.character_maximum_length,
+              c.numeric_precision,
+              c.numeric_scale
+            FROM information_schema.columns c
+            JOIN information_schema.tables t
+              ON t.table_schema = c.table_schema
+             AND t.table_name = c.table_name
+            WHERE c.table_schema = %s
+              AND t.table_type = 'BASE TABLE'
+            ORDER BY c.table_name, c.ordinal_position
             """,
             (schema,),
         )
@@ -229,25 +376,43 @@ def fetch_columns(conn, schema: str) -> Dict[str, List[ColumnInfo]]:
     return out
 
 
-def fetch_primary_keys(conn, schema: str) -> Dict[str, PrimaryKey]:
+def fetch_key_constraints(conn, schema: str) -> Tuple[Dict[str, PrimaryKey], Dict[str, Set[str]]]:
+    """
+    One round-trip for both PRIMARY KEY and UNIQUE metadata.
+
+    Returns:
+      - {table: PrimaryKey}
+      - {table_lc: {col, ...}} for single-column UNIQUE constraints only
+        (table keys lowercased to avoid casing mismatches)
+    """
     with conn.cursor() as cur:
         cur.execute(
             """
-            SELECT tc.table_name, kcu.column_name, kcu.ordinal_position
+            SELECT tc.table_name, tc.constraint_name, tc.constraint_type, kcu.column_name
             FROM information_schema.table_constraints tc
             JOIN information_schema.key_column_usage kcu
               ON tc.constraint_name = kcu.constraint_name
              AND tc.table_schema = kcu.table_schema
             WHERE tc.table_schema = %s
-              AND tc.constraint_type = 'PRIMARY KEY'
-            ORDER BY tc.table_name, kcu.ordinal_position
+              AND tc.constraint_type IN ('PRIMARY KEY', 'UNIQUE')
+            ORDER BY tc.table_name, tc.constraint_name, kcu.ordinal_position
             """,
             (schema,),
         )
-        tmp: Dict[str, List[str]] = {}
-        for t, c, _ in cur.fetchall():
-            tmp.setdefault(t, []).append(c)
-    return {t: PrimaryKey(table=t, columns=tuple(cols)) for t, cols in tmp.items()}
+        pk_cols: Dict[str, List[str]] = {}
+        uniq_constraints: Dict[Tuple[str, str], List[str]] = {}
+        for t, con, con_type, c in cur.fetchall():
+            if con_type == "PRIMARY KEY":
+                pk_cols.setdefault(t, []).append(c)
+            else:
+                uniq_constraints.setdefault((t, con), []).append(c)
+
+    pks = {t: PrimaryKey(table=t, columns=tuple(cols)) for t, cols in pk_cols.items()}
+    unique_cols: Dict[str, Set[str]] = {}
+    for (t, _), cols in uniq_constraints.items():
+        if len(cols) == 1:
+            unique_cols.setdefault(t.lower(), set()).add(cols[0])
+    return pks, unique_cols
 
 
 def fetch_foreign_keys(conn, schema: str) -> List[ForeignKey]:
@@ -291,47 +456,39 @@ def fetch_enum_values(conn) -> Dict[str, List[str]]:
         return out
 
 
-def fetch_unique_columns(conn, schema: str) -> Dict[str, Set[str]]:
+def fetch_catalog_metadata(schema: str):
     """
-    ✅ ONLY single-column UNIQUE constraints: {table_lc: {col,...}}
-    Store table keys lowercased to avoid casing mismatches.
+    Run the four catalog queries (columns, PK+UNIQUE, FKs, enums) on parallel
+    connections so the introspection phase pays one round-trip of latency
+    instead of four. psycopg2 has no pipeline mode, so overlapping the
+    queries across connections is the equivalent move.
     """
-    with conn.cursor() as cur:
-        cur.execute(
-            """
-            WITH uniq AS (
-              SELECT
-                tc.table_schema,
-                tc.table_name,
-                tc.constraint_name,
-                COUNT(kcu.column_name) AS col_count
-              FROM information_schema.table_constraints tc
-              JOIN information_schema.key_column_usage kcu
-                ON tc.constraint_name = kcu.constraint_name
-               AND tc.table_schema = kcu.table_schema
-              WHERE tc.table_schema = %s
-                AND tc.constraint_type = 'UNIQUE'
-              GROUP BY 1,2,3
-            )
-            SELECT kcu.table_name, kcu.column_name
-            FROM uniq
-            JOIN information_schema.key_column_usage kcu
-              ON uniq.constraint_name = kcu.constraint_name
-             AND uniq.table_schema = kcu.table_schema
-            WHERE uniq.col_count = 1
-            """,
-            (schema,),
-        )
-        out: Dict[str, Set[str]] = {}
-        for t, c in cur.fetchall():
-            out.setdefault(t.lower(), set()).add(c)
-        return out
+
+    def _with_conn(fn, *args):
+        c = psycopg2.connect(pg_dsn(PG))
+        try:
+            return fn(c, *args)
+        finally:
+            c.close()
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        f_cols = pool.submit(_with_conn, fetch_columns, schema)
+        f_keys = pool.submit(_with_conn, fetch_key_constraints, schema)
+        f_fks = pool.submit(_with_conn, fetch_foreign_keys, schema)
+        f_enums = pool.submit(_with_conn, fetch_enum_values)
+    pks, unique_cols = f_keys.result()
+    return f_cols.result(), pks, unique_cols, f_fks.result(), f_enums.result()
 
 
 # -------------------------
 # Dependency ordering
 # -------------------------
 def topo_sort_tables(tables: List[str], fks: List[ForeignKey]) -> List[str]:
+    """
+    Kahn's algorithm over the FK graph with indegree counters; a heap (rather
+    than a deque) keeps the old alphabetical tie-breaking among ready tables.
+    Tables stuck in an FK cycle are appended in name order at the end.
+    """
     deps: Dict[str, Set[str]] = {t: set() for t in tables}
     rdeps: Dict[str, Set[str]] = {t: set() for t in tables}
 
@@ -340,30 +497,69 @@ def topo_sort_tables(tables: List[str], fks: List[ForeignKey]) -> List[str]:
             deps[fk.table].add(fk.ref_table)
             rdeps[fk.ref_table].add(fk.table)
 
-    q = sorted([t for t in tables if not deps[t]])
+    indeg = {t: len(deps[t]) for t in tables}
+    heap = [t for t in tables if not indeg[t]]
+    heapq.heapify(heap)
     out: List[str] = []
 
-    while q:
-        n = q.pop(0)
+    while heap:
+        n = heapq.heappop(heap)
         out.append(n)
-        for m in sorted(rdeps[n]):
-            deps[m].discard(n)
-            if not deps[m] and m not in out and m not in q:
-                q.append(m)
-        q.sort()
+        for m in rdeps[n]:
+            indeg[m] -= 1
+            if not indeg[m]:
+                heapq.heappush(heap, m)
+
+    if len(out) < len(tables):
+        done = set(out)
+        out += sorted(t for t in tables if t not in done)
+    return out
 
-    remaining = [t for t in tables if t not in out]
-    return out + sorted(remaining)
+
+def fk_levels(tables: List[str], fks: List[ForeignKey]) -> List[List[str]]:
+    """
+    Group tables into FK dependency levels: every table in level k only
+    references tables in levels < k, so tables within one level can be
+    generated and loaded concurrently.
+    """
+    deps: Dict[str, Set[str]] = {t: set() for t in tables}
+    for fk in fks:
+        if fk.table in deps and fk.ref_table in deps and fk.table != fk.ref_table:
+            deps[fk.table].add(fk.ref_table)
+
+    levels: List[List[str]] = []
+    done: Set[str] = set()
+    remaining = set(tables)
+    while remaining:
+        ready = sorted(t for t in remaining if deps[t] <= done)
+        if not ready:
+            # FK cycle: load the rest serially in name order.
+            levels.append(sorted(remaining))
+            break
+        levels.append(ready)
+        done.update(ready)
+        remaining.difference_update(ready)
+    return levels
 
 
 # -------------------------
 # Default row counts
 # -------------------------
+# Keyword classifiers compiled once: a single C-level regex scan replaces a
+# chain of Python-level substring tests per name.
+_CATALOG_RE = re.compile(r"lookup|type|status|code|catalog|policy|rate_plan|rate_calendar")
+_TXN_RE = re.compile(r"payment|invoice|transaction|charge")
+_REFUND_RE = re.compile(r"refund|cancellation")
+_RATING_RE = re.compile(r"rating|stars|score")
+_COUNT_RE = re.compile(r"count|qty|quantity|nights|floor|occupancy")
+_MONEY_RE = re.compile(r"amount|price|rate|cost|fee|total|tax")
+
+
 def default_row_counts(tables: List[str]) -> Dict[str, int]:
     rc: Dict[str, int] = {}
     for t in tables:
         tl = t.lower()
-        if any(k in tl for k in ["lookup", "type", "status", "code", "catalog", "policy", "rate_plan", "rate_calendar"]):
+        if _CATALOG_RE.search(tl):
             rc[t] = 50
         elif tl == "hotel":
             rc[t] = 12
@@ -373,28 +569,94 @@ def default_row_counts(tables: List[str]) -> Dict[str, int]:
             rc[t] = 30_000
         elif "booking" in tl:
             rc[t] = 70_000
-        elif any(k in tl for k in ["payment", "invoice", "transaction", "charge"]):
+        elif _TXN_RE.search(tl):
             rc[t] = 60_000
-        elif any(k in tl for k in ["refund", "cancellation"]):
+        elif _REFUND_RE.search(tl):
             rc[t] = 8_000
         else:
             rc[t] = 2_000
     return rc
 
 
+# -------------------------
+# Batched UUIDs
+# -------------------------
+# uuid.uuid4() per row is dominated by Python/syscall overhead around
+# os.urandom(16); mint a few thousand ids per urandom call instead.
+_UUID_BATCH = 4096
+_UUID_POOL: List[str] = []
+
+
+def _next_uuid_hex() -> str:
+    if not _UUID_POOL:
+        buf = np.frombuffer(os.urandom(16 * _UUID_BATCH), dtype=np.uint8).reshape(_UUID_BATCH, 16).copy()
+        buf[:, 6] = (buf[:, 6] & 0x0F) | 0x40  # version 4
+        buf[:, 8] = (buf[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+        _UUID_POOL.extend(row.tobytes().hex() for row in buf)
+    return _UUID_POOL.pop()
+
+
+def _next_uuid_str() -> str:
+    h = _next_uuid_hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+# Monotonic counter for short uniquifying suffixes. Unlike random hex a
+# counter cannot collide within a run, and formatting an int is cheaper than
+# drawing and slicing a uuid.
+_UID_COUNTER = itertools.count(1)
+
+
+def short_uid() -> str:
+    return f"{next(_UID_COUNTER):06x}"
+
+
 # -------------------------
 # Unique text registry
 # -------------------------
 _UNIQUE_SEEN: Dict[Tuple[str, str], Set[str]] = {}
+# Pre-minted candidates per column; topped up in batches so the common path
+# is a plain popleft with no membership test at all.
+_UNIQUE_RESERVOIR: Dict[Tuple[str, str], deque] = {}
+_UNIQUE_BATCH = 256
+
+
+def unique_text(key: Tuple[str, str], make_value) -> str:
+    pool = _UNIQUE_RESERVOIR.get(key)
+    if pool is None:
+        pool = _UNIQUE_RESERVOIR[key] = deque()
+    if not pool:
+        # Mint a batch and dedupe it in bulk instead of testing each request
+        # against an ever-fuller seen set one candidate at a time.
+        seen = _UNIQUE_SEEN.setdefault(key, set())
+        for _ in range(_UNIQUE_BATCH):
+            v = str(make_value()).strip()
+            if v and v not in seen:
+                seen.add(v)
+                pool.append(v)
+        if not pool:
+            # A whole batch of misses means make_value's candidate space is
+            # exhausted; force uniqueness with a counter suffix instead of
+            # minting forever.
+            v = f"{str(make_value()).strip()}_{short_uid()}"
+            seen.add(v)
+            pool.append(v)
+    return pool.popleft()
 
 
-def unique_text(key: Tuple[str, str], make_value, max_tries: int = 200000) -> str:
-    seen = _UNIQUE_SEEN.setdefault(key, set())
-    for _ in range(max_tries):
-        v = str(make_value()).strip()
-        if v and v not in seen:
-            seen.add(v)
-            return v
+# Emails: uniqueness by construction (sequence in the local part) instead of a
+# grow-forever seen-set with regenerate-on-collision. O(1) per row at any N.
+_EMAIL_DOMAINS = ("example.com", "example.net", "example.org")
+_EMAIL_SEQ: Dict[Tuple[str, str], int] = {}
+
+
+def _unique_email(fake: Faker, col: ColumnInfo) -> str:
+    key = (col.table, col.column)
+    seq = _EMAIL_SEQ.get(key, 0) + 1
+    _EMAIL_SEQ[key] = seq
+    first = fake.first_name().lower()
+    last = fake.last_name().lower()
+    return f"{first}.{last}.{seq:06d}@{_EMAIL_DOMAINS[seq % len(_EMAIL_DOMAINS)]}"
 
 
 # Deterministic-ish unique choice from a small list (for UNIQUE(name) dimension tables)
@@ -405,136 +667,205 @@ def unique_choice_from_pool(key, base_list, maxlen: int | None = None) -> str:
     Returns values from base_list without repeats until exhausted; then falls back to suffixing.
     key: (table, column) or any hashable identifier
     """
-    st=_UNIQUE_POOL_STATE.get(key)
+    st = _UNIQUE_POOL_STATE.get(key)
     if st is None:
-        pool=list(base_list)
-        random.shuffle(pool)
-        st={"pool": pool}
-        _UNIQUE_POOL_STATE[key]=st
-    pool=st["pool"]
-    if pool:
-        v=pool.pop()
+        # Permutation-of-indices + cursor: no copy of base_list, no shuffle
+        # of the values themselves, and unused entries cost nothing.
+        st = {"perm": _NP_RNG.permutation(len(base_list)), "i": 0}
+        _UNIQUE_POOL_STATE[key] = st
+    i = st["i"]
+    if i < len(st["perm"]):
+        st["i"] = i + 1
+        v = base_list[st["perm"][i]]
     else:
-        v=f"{random.choice(base_list)}_{uuid.uuid4().hex[:6]}"
+        v = f"{random.choice(base_list)}_{short_uid()}"
     if maxlen is not None:
         return str(v)[:maxlen]
     return str(v)
-    raise RuntimeError(f"Could not generate unique value for {key}")
 
 
 # -------------------------
 # Value generator
 # -------------------------
-def generate_value(fake: Faker, col: ColumnInfo, row_idx: int, enums: Dict[str, List[str]]) -> Any:
-    name = col.column.lower()
-    dt = col.data_type.lower()
-    udt = col.udt_name.lower()
+def compile_column_generator(fake: Faker, col: ColumnInfo, enums: Dict[str, List[str]]):
+    """
+    Partially evaluate the value dispatch for one column: all the name/type
+    inspection (lowercasing, keyword scans, enum lookup) happens once here,
+    and the returned closure does only the per-row draw. With ~20 columns x
+    70k rows per table, the old per-cell branch chain was pure overhead.
+    """
+    name = col.column_lc
+    dt = col.data_type_lc
+    udt = col.udt_name_lc
+    table = col.table
+    table_lc = table.lower()
 
     # ENUM
     if udt in enums:
-        if col.is_nullable and random.random() < 0.03:
-            return None
-        return random.choice(enums[udt])
+        labels = enums[udt]
+        if col.is_nullable:
+            return lambda i: None if _rand() < 0.03 else _rand_choice(labels)
+        return lambda i: _rand_choice(labels)
 
     # standard timestamps
     if name in {"created_at", "updated_at", "loaded_at", "ingested_at"}:
-        base = fake.date_time_between(start_date="-2y", end_date="now", tzinfo=timezone.utc)
         if name == "updated_at":
-            base = base + timedelta(days=random.randint(0, 180))
-        return base
+            return lambda i: fake.date_time_between(
+                start_date="-2y", end_date="now", tzinfo=timezone.utc
+            ) + timedelta(days=_rand_int(0, 180))
+        return lambda i: fake.date_time_between(start_date="-2y", end_date="now", tzinfo=timezone.utc)
 
     # date
     if dt == "date":
-        return fake.date_between(start_date="-2y", end_date="+1y")
+        return lambda i: fake.date_between(start_date="-2y", end_date="+1y")
 
     if dt in {"timestamp without time zone", "timestamp with time zone"} or udt in {"timestamp", "timestamptz"}:
-        return fake.date_time_between(start_date="-2y", end_date="now", tzinfo=timezone.utc)
+        return lambda i: fake.date_time_between(start_date="-2y", end_date="now", tzinfo=timezone.utc)
 
     # int
     if dt in {"integer", "bigint", "smallint"} or udt in {"int2", "int4", "int8"}:
         if name.endswith("_id"):
-            return row_idx
-        if name == "score":
-            return random.randint(1, 5)
-        if any(k in name for k in ["rating", "stars", "score"]):
-            return random.randint(1, 5)
-        if any(k in name for k in ["count", "qty", "quantity", "nights", "floor", "occupancy"]):
-            return random.randint(1, 10)
-        return random.randint(1, 100000)
+            return lambda i: i
+        if name == "score" or _RATING_RE.search(name):
+            return lambda i: _rand_int(1, 5)
+        if _COUNT_RE.search(name):
+            return lambda i: _rand_int(1, 10)
+        return lambda i: _rand_int(1, 100000)
 
     # uuid
     if dt == "uuid" or udt == "uuid":
-        return str(uuid.uuid4())
+        return lambda i: _next_uuid_str()
 
     # bool
     if dt == "boolean":
-        return random.random() < 0.85 if ("is_" in name or name.endswith("_flag")) else (random.random() < 0.5)
+        p_true = 0.85 if ("is_" in name or name.endswith("_flag")) else 0.5
+        return lambda i: _rand() < p_true
 
     # numeric/decimal
     if dt in {"numeric", "decimal"} or udt == "numeric":
         scale = col.numeric_scale or 2
         if "percent" in name or name.endswith("_pct") or name.endswith("pct"):
-            return round(random.uniform(0, 100), scale)
-        if "ratio" in name or "fraction" in name:
-            return round(random.uniform(0, 1), scale)
-        if col.table.lower() == "promotion" and name in {"value", "discount_value", "discount_amount", "discount"}:
-            return round(random.uniform(5, 50), scale)
-        if any(k in name for k in ["amount", "price", "rate", "cost", "fee", "total", "tax"]):
-            return round(random.uniform(20, 2000), scale)
-        return round(random.uniform(0, 1000), scale)
+            lo, hi = 0, 100
+        elif "ratio" in name or "fraction" in name:
+            lo, hi = 0, 1
+        elif table_lc == "promotion" and name in {"value", "discount_value", "discount_amount", "discount"}:
+            lo, hi = 5, 50
+        elif _MONEY_RE.search(name):
+            lo, hi = 20, 2000
+        else:
+            lo, hi = 0, 1000
+        return lambda i: round(_rand_uniform(lo, hi), scale)
 
     # text/varchar
     if dt in {"character varying", "character", "text"}:
         maxlen = col.char_max_len or 255
         # location-aware fields (keep city/state/country/timezone consistent per row)
-        if name in {"city", "state", "country", "postal_code", "zipcode", "zip"} or "timezone" in name or name in {"address_line1", "address_line2", "street", "street1", "street2"}:
-            loc = get_row_location(fake, col.table, row_idx)
-            if "timezone" in name:
-                return loc.get("timezone", "America/New_York")[:maxlen]
-            if name in {"city"}:
-                return loc["city"][:maxlen]
-            if name in {"state"}:
-                return loc["state"][:maxlen]
-            if name in {"country"}:
-                return loc["country"][:maxlen]
-            if name in {"postal_code", "zipcode", "zip"}:
-                return str(loc.get("postal_code", "00000"))[:maxlen]
-            if name in {"address_line1", "street", "street1"}:
-                return loc.get("street1")[:maxlen]
-            if name in {"address_line2", "street2"}:
-                v = loc.get("street2")
-                return ("" if v is None else str(v))[:maxlen]
+        loc_field = None
+        if "timezone" in name:
+            loc_field = "timezone"
+        elif name in {"city", "state", "country"}:
+            loc_field = name
+        elif name in {"postal_code", "zipcode", "zip"}:
+            loc_field = "postal_code"
+        elif name in {"address_line1", "street", "street1"}:
+            loc_field = "street1"
+        elif name in {"address_line2", "street2"}:
+            loc_field = "street2"
+        if loc_field is not None:
+            return lambda i: str(get_row_location(fake, table, i)[loc_field])[:maxlen]
 
         # more meaningful domain strings
-        if col.table.lower() == "hotel" and name in {"name", "hotel_name"}:
-            brand = random.choice(HOTEL_BRANDS)
-            loc = get_row_location(fake, col.table, row_idx)
-            base = f"{brand} {loc['city']}"
-            suffix = random.choice(["Hotel", "Resort", "Suites", "Inn"])
-            return f"{base} {suffix}"[:maxlen]
-        if col.table.lower() == "room_type" and name in {"name", "room_type_name"}:
-            return unique_choice_from_pool((col.table, col.column), ROOM_TYPE_NAMES, maxlen)
+        if table_lc == "hotel" and name in {"name", "hotel_name"}:
+            def _hotel_name(i: int) -> str:
+                brand = _rand_choice(HOTEL_BRANDS)
+                loc = get_row_location(fake, table, i)
+                suffix = _rand_choice(["Hotel", "Resort", "Suites", "Inn"])
+                return f"{brand} {loc['city']} {suffix}"[:maxlen]
+            return _hotel_name
+        if table_lc == "room_type" and name in {"name", "room_type_name"}:
+            return lambda i: unique_choice_from_pool((table, col.column), ROOM_TYPE_NAMES, maxlen)
         if name in {"phone", "phone_number"}:
-            return fake.phone_number()[:maxlen]
+            return lambda i: fake.phone_number()[:maxlen]
         if name in {"currency", "currency_code"}:
-            return random.choice(["USD", "INR"])[:maxlen]
+            return lambda i: _rand_choice(["USD", "INR"])[:maxlen]
         if name in {"state_code", "state_abbr"}:
-            loc = get_row_location(fake, col.table, row_idx)
-            return loc.get("state", "NA")[:maxlen]
-        if "timezone" in name:
-            # fallback if location table not used in this row
-            return "America/New_York"[:maxlen]
+            return lambda i: str(get_row_location(fake, table, i)["state"])[:maxlen]
         if name == "email":
-            return unique_text((col.table, col.column), lambda: fake.email())[:maxlen]
+            return lambda i: _unique_email(fake, col)[:maxlen]
         if name.endswith("_name") or name in {"name", "code"}:
-            return unique_text((col.table, col.column), lambda: f"{fake.word().title()}_{uuid.uuid4().hex[:6]}")[:maxlen]
-        if "timezone" in name:
-            return "America/New_York"[:maxlen]
+            key = (table, col.column)
+            return lambda i: unique_text(key, lambda: f"{fake.word().title()}_{short_uid()}")[:maxlen]
         if maxlen <= 20:
-            return fake.word()[:maxlen]
+            return lambda i: fake.word()[:maxlen]
         if maxlen <= 80:
-            return fake.sentence(nb_words=6)[:maxlen]
-        return fake.sentence(nb_words=10)[:maxlen]
+            return lambda i: fake.sentence(nb_words=6)[:maxlen]
+        return lambda i: fake.sentence(nb_words=10)[:maxlen]
+
+    return lambda i: None
+
+
+# One compiled closure per (table, column), built lazily on first use.
+_COL_GEN_CACHE: Dict[Tuple[str, str], Any] = {}
+
+
+def column_generator(fake: Faker, col: ColumnInfo, enums: Dict[str, List[str]]):
+    key = (col.table, col.column)
+    gen = _COL_GEN_CACHE.get(key)
+    if gen is None:
+        gen = compile_column_generator(fake, col, enums)
+        _COL_GEN_CACHE[key] = gen
+    return gen
+
+
+def generate_value(fake: Faker, col: ColumnInfo, row_idx: int, enums: Dict[str, List[str]]) -> Any:
+    return column_generator(fake, col, enums)(row_idx)
+
+
+def draw_enum_labels(labels: List[str], n: int, nullable: bool) -> np.ndarray:
+    """One batched draw of n enum labels (object array; ~3% None when nullable)."""
+    labels_arr = np.array(labels, dtype=object)
+    draw = labels_arr[_NP_RNG.integers(0, len(labels_arr), size=n)]
+    if nullable:
+        draw[_NP_RNG.random(n) < 0.03] = None
+    return draw
+
+
+def bulk_numeric_fill(col: ColumnInfo, n: int) -> Optional[List[Any]]:
+    """
+    Whole-column fill for int/numeric/boolean columns as one vectorized draw,
+    mirroring the ranges compile_column_generator uses per row. Returns None
+    for types that still need the per-row closure (dates, text, enums).
+    """
+    name = col.column_lc
+    dt = col.data_type_lc
+    udt = col.udt_name_lc
+
+    if dt in {"integer", "bigint", "smallint"} or udt in {"int2", "int4", "int8"}:
+        if name.endswith("_id"):
+            return list(range(1, n + 1))
+        if name == "score" or _RATING_RE.search(name):
+            return _NP_RNG.integers(1, 6, size=n).tolist()
+        if _COUNT_RE.search(name):
+            return _NP_RNG.integers(1, 11, size=n).tolist()
+        return _NP_RNG.integers(1, 100001, size=n).tolist()
+
+    if dt == "boolean":
+        p_true = 0.85 if ("is_" in name or name.endswith("_flag")) else 0.5
+        return (_NP_RNG.random(n) < p_true).tolist()
+
+    if dt in {"numeric", "decimal"} or udt == "numeric":
+        scale = col.numeric_scale or 2
+        if "percent" in name or name.endswith("_pct") or name.endswith("pct"):
+            lo, hi = 0, 100
+        elif "ratio" in name or "fraction" in name:
+            lo, hi = 0, 1
+        elif col.table.lower() == "promotion" and name in {"value", "discount_value", "discount_amount", "discount"}:
+            lo, hi = 5, 50
+        elif _MONEY_RE.search(name):
+            lo, hi = 20, 2000
+        else:
+            lo, hi = 0, 1000
+        return np.round(_NP_RNG.uniform(lo, hi, size=n), scale).tolist()
 
     return None
 
@@ -546,9 +877,125 @@ def build_fk_map(fks: List[ForeignKey]) -> Dict[Tuple[str, str], Tuple[str, str]
     return {(fk.table.lower(), fk.column): (fk.ref_table.lower(), fk.ref_column) for fk in fks}
 
 
+@dataclass(frozen=True)
+class TableSpec:
+    """Per-table column metadata the generators would otherwise rebuild on
+    every call: name lists, lowercase->actual and name->position maps, the
+    per-column FK target, and the single-column UNIQUE set."""
+
+    table_lc: str
+    colnames: Tuple[str, ...]
+    col_lc: Dict[str, str]
+    col_pos: Dict[str, int]
+    by_name: Dict[str, ColumnInfo]
+    fk_by_col: Dict[str, Optional[Tuple[str, str]]]
+    uniq_cols: frozenset
+
+
+_TABLE_SPECS: Dict[str, TableSpec] = {}
+
+
+def table_spec(
+    table: str,
+    cols: List[ColumnInfo],
+    fk_map: Dict[Tuple[str, str], Tuple[str, str]],
+    unique_cols: Optional[Dict[str, Set[str]]] = None,
+) -> TableSpec:
+    tl = table.lower()
+    spec = _TABLE_SPECS.get(tl)
+    if spec is None:
+        spec = TableSpec(
+            table_lc=tl,
+            colnames=tuple(c.column for c in cols),
+            col_lc={c.column_lc: c.column for c in cols},
+            col_pos={c.column: j for j, c in enumerate(cols)},
+            by_name={c.column: c for c in cols},
+            fk_by_col={c.column: fk_map.get((tl, c.column)) for c in cols},
+            uniq_cols=frozenset((unique_cols or {}).get(tl, set())),
+        )
+        _TABLE_SPECS[tl] = spec
+    return spec
+
+
 # -------------------------
 # Special-case generators
 # -------------------------
+def _unique_index_pairs(n_a: int, n_b: int, n_rows: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Draw up to n_rows distinct (i, j) index pairs into two pools of size
+    n_a x n_b: batched integer draws over the flattened pair space, deduped
+    with np.unique — no per-pair retry loop, no exceptions. Result order is
+    shuffled so pairs are not sorted.
+    """
+    max_pairs = n_a * n_b
+    n = min(n_rows, max_pairs)
+    if n * 2 >= max_pairs:
+        # Dense case: drawing-with-dedupe degrades to the coupon-collector
+        # tail as coverage approaches max_pairs, so permute the whole pair
+        # space once and take a prefix instead.
+        chosen = _NP_RNG.permutation(max_pairs)[:n]
+        return chosen // n_b, chosen % n_b
+    chosen = np.empty(0, dtype=np.int64)
+    while len(chosen) < n:
+        need = n - len(chosen)
+        draw = _NP_RNG.integers(0, max_pairs, size=int(need * 1.3) + 16)
+        chosen = np.unique(np.concatenate([chosen, draw]))
+    chosen = _NP_RNG.permutation(chosen)[:n]
+    return chosen // n_b, chosen % n_b
+
+
+def _fill_generic_columns(
+    *,
+    fake: Faker,
+    table_lc: str,
+    cols: List[ColumnInfo],
+    fk_map: Dict[Tuple[str, str], Tuple[str, str]],
+    ref_ids: Dict[str, np.ndarray],
+    enums: Dict[str, List[str]],
+    columns: Dict[str, List[Any]],
+    n: int,
+) -> None:
+    """
+    Fill the remaining (non-key) columns of a link table as whole columns
+    (SoA) instead of per-row dicts: FK columns get one batched rng.choice
+    draw, everything else a generate_value list per column.
+    """
+    for c in cols:
+        if c.column in columns:
+            continue
+        fk_key = (table_lc, c.column)
+        if fk_key in fk_map:
+            parent_table, _ = fk_map[fk_key]
+            candidates = ref_ids.get(parent_table)
+            if candidates is not None and len(candidates):
+                columns[c.column] = list(_NP_RNG.choice(candidates, size=n, replace=True))
+            else:
+                columns[c.column] = [None if c.is_nullable else 1] * n
+            continue
+        bulk = bulk_numeric_fill(c, n)
+        if bulk is not None:
+            columns[c.column] = bulk
+            continue
+        gen = column_generator(fake, c, enums)
+        vals = [gen(i) for i in range(1, n + 1)]
+        if not c.is_nullable:
+            is_int = c.data_type_lc in {"integer", "bigint", "smallint"}
+            vals = [
+                v if v is not None else (1 if is_int else f"VAL_{short_uid()}")
+                for v in vals
+            ]
+        columns[c.column] = vals
+
+
+def _write_columns_csv(path: Path, colnames: List[str], columns: Dict[str, List[Any]]) -> None:
+    """One writerows call over the zipped column buffers — the row iteration
+    happens inside the csv module instead of a Python-level dict.get per cell."""
+    with path.open("w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(colnames)
+        w.writerows(zip(*(columns[cn] for cn in colnames)))
+
+
 def generate_booking_room_csv(
     *,
     fake: Faker,
@@ -556,19 +1003,20 @@ def generate_booking_room_csv(
     table: str,
     cols: List[ColumnInfo],
     fk_map: Dict[Tuple[str, str], Tuple[str, str]],
-    ref_ids: Dict[str, List[Any]],
+    ref_ids: Dict[str, np.ndarray],
     n_rows: int,
     enums: Dict[str, List[str]],
 ) -> Path:
     out_dir.mkdir(parents=True, exist_ok=True)
     path = out_dir / f"{table}.csv"
-    colnames = [c.column for c in cols]
-    col_lc = {c.column.lower(): c.column for c in cols}
-    table_lc = table.lower()
-
-    booking_ids = list(ref_ids.get("booking", []))
-    room_ids = list(ref_ids.get("room", []))
-    if not booking_ids or not room_ids:
+    spec = table_spec(table, cols, fk_map)
+    colnames = list(spec.colnames)
+    col_lc = spec.col_lc
+    table_lc = spec.table_lc
+
+    booking_ids = np.asarray(ref_ids.get("booking", []))
+    room_ids = np.asarray(ref_ids.get("room", []))
+    if not len(booking_ids) or not len(room_ids):
         raise RuntimeError("booking_room needs booking and room ids available before generation.")
 
     booking_id_col = col_lc.get("booking_id")
@@ -576,48 +1024,19 @@ def generate_booking_room_csv(
     if not booking_id_col or not room_id_col:
         raise RuntimeError("booking_room expected columns booking_id and room_id.")
 
-    seen: set[tuple[Any, Any]] = set()
-    rows: List[Dict[str, Any]] = []
+    # UNIQUE(booking_id, room_id): batched index-pair draws, deduped in one pass.
+    b_idx, r_idx = _unique_index_pairs(len(booking_ids), len(room_ids), n_rows)
+    n = len(b_idx)
 
-    random.shuffle(booking_ids)
-
-    i = 0
-    while len(rows) < n_rows:
-        b = booking_ids[i % len(booking_ids)]
-        rooms_for_booking = random.randint(1, 3)
-        for _ in range(rooms_for_booking):
-            r = random.choice(room_ids)
-            pair = (b, r)
-            if pair in seen:
-                continue
-            seen.add(pair)
-
-            row: Dict[str, Any] = {booking_id_col: b, room_id_col: r}
-            for c in cols:
-                if c.column in row:
-                    continue
-                fk_key = (table_lc, c.column)
-                if fk_key in fk_map:
-                    parent_table, _ = fk_map[fk_key]
-                    candidates = ref_ids.get(parent_table, [])
-                    row[c.column] = random.choice(candidates) if candidates else (None if c.is_nullable else 1)
-                else:
-                    v = generate_value(fake, c, len(rows) + 1, enums)
-                    if v is None and not c.is_nullable:
-                        v = 1 if c.data_type.lower() in {"integer", "bigint", "smallint"} else f"VAL_{uuid.uuid4().hex[:6]}"
-                    row[c.column] = v
-
-            rows.append(row)
-            if len(rows) >= n_rows:
-                break
-        i += 1
-
-    with path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        w.writerow(colnames)
-        for row in rows[:n_rows]:
-            w.writerow([row.get(cn) for cn in colnames])
+    columns: Dict[str, List[Any]] = {
+        booking_id_col: list(booking_ids[b_idx]),
+        room_id_col: list(room_ids[r_idx]),
+    }
+    _fill_generic_columns(
+        fake=fake, table_lc=table_lc, cols=cols, fk_map=fk_map, ref_ids=ref_ids, enums=enums, columns=columns, n=n
+    )
 
+    _write_columns_csv(path, colnames, columns)
     return path
 
 
@@ -628,18 +1047,19 @@ def generate_room_night_csv(
     table: str,
     cols: List[ColumnInfo],
     fk_map: Dict[Tuple[str, str], Tuple[str, str]],
-    ref_ids: Dict[str, List[Any]],
+    ref_ids: Dict[str, np.ndarray],
     n_rows: int,
     enums: Dict[str, List[str]],
 ) -> Path:
     out_dir.mkdir(parents=True, exist_ok=True)
     path = out_dir / f"{table}.csv"
-    colnames = [c.column for c in cols]
-    col_lc = {c.column.lower(): c.column for c in cols}
-    table_lc = table.lower()
+    spec = table_spec(table, cols, fk_map)
+    colnames = list(spec.colnames)
+    col_lc = spec.col_lc
+    table_lc = spec.table_lc
 
-    room_ids = list(ref_ids.get("room", []))
-    if not room_ids:
+    room_ids = np.asarray(ref_ids.get("room", []))
+    if not len(room_ids):
         raise RuntimeError("room_night needs room ids available before generation.")
 
     room_id_col = col_lc.get("room_id")
@@ -651,49 +1071,22 @@ def generate_room_night_csv(
     end = date.today() + timedelta(days=365)
     total_days = (end - start).days
 
-    seen: set[tuple[Any, date]] = set()
-    rows: List[Dict[str, Any]] = []
-
-    per_room = max(1, n_rows // len(room_ids))
-    random.shuffle(room_ids)
-
-    for rid in room_ids:
-        if len(rows) >= n_rows:
-            break
-        k = min(per_room, total_days)
-        offsets = random.sample(range(total_days), k=k)
-        for off in offsets:
-            nd = start + timedelta(days=off)
-            pair = (rid, nd)
-            if pair in seen:
-                continue
-            seen.add(pair)
-
-            row: Dict[str, Any] = {room_id_col: rid, night_date_col: nd}
-            for c in cols:
-                if c.column in row:
-                    continue
-                fk_key = (table_lc, c.column)
-                if fk_key in fk_map:
-                    parent_table, _ = fk_map[fk_key]
-                    candidates = ref_ids.get(parent_table, [])
-                    row[c.column] = random.choice(candidates) if candidates else (None if c.is_nullable else 1)
-                else:
-                    v = generate_value(fake, c, len(rows) + 1, enums)
-                    if v is None and not c.is_nullable:
-                        v = 1 if c.data_type.lower() in {"integer", "bigint", "smallint"} else f"VAL_{uuid.uuid4().hex[:6]}"
-                    row[c.column] = v
-
-            rows.append(row)
-            if len(rows) >= n_rows:
-                break
-
-    with path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        w.writerow(colnames)
-        for row in rows[:n_rows]:
-            w.writerow([row.get(cn) for cn in colnames])
-
+    # UNIQUE(room_id, night_date): (room, day-offset) is just another pair
+    # space, so sample it like booking_room does and turn the offsets into
+    # dates with one vectorized datetime64 add.
+    r_idx, offsets = _unique_index_pairs(len(room_ids), total_days, n_rows)
+    n = len(r_idx)
+    night_dates = (np.datetime64(start) + offsets.astype("timedelta64[D]")).tolist()
+
+    columns: Dict[str, List[Any]] = {
+        room_id_col: list(room_ids[r_idx]),
+        night_date_col: night_dates,
+    }
+    _fill_generic_columns(
+        fake=fake, table_lc=table_lc, cols=cols, fk_map=fk_map, ref_ids=ref_ids, enums=enums, columns=columns, n=n
+    )
+
+    _write_columns_csv(path, colnames, columns)
     return path
 
 
@@ -704,7 +1097,7 @@ def generate_stay_csv(
     table: str,
     cols: List[ColumnInfo],
     fk_map: Dict[Tuple[str, str], Tuple[str, str]],
-    ref_ids: Dict[str, List[Any]],
+    ref_ids: Dict[str, np.ndarray],
     n_rows: int,
     enums: Dict[str, List[str]],
     unique_cols: Dict[str, Set[str]],
@@ -717,9 +1110,10 @@ def generate_stay_csv(
     """
     out_dir.mkdir(parents=True, exist_ok=True)
     path = out_dir / f"{table}.csv"
-    colnames = [c.column for c in cols]
-    col_lc = {c.column.lower(): c.column for c in cols}
-    table_lc = table.lower()
+    spec = table_spec(table, cols, fk_map, unique_cols)
+    colnames = list(spec.colnames)
+    col_lc = spec.col_lc
+    table_lc = spec.table_lc
 
     booking_id_col = col_lc.get("booking_id")
     status_col = col_lc.get("stay_status") or col_lc.get("status")
@@ -735,156 +1129,136 @@ def generate_stay_csv(
                 f'{table_lc}."{booking_id_col}" is UNIQUE but only {len(booking_ids)} booking ids exist '
                 f"for requested n_rows={n_rows}."
             )
-        random.shuffle(booking_ids)
+        # Only the first n_rows ids are consumed, so sample that many without
+        # replacement instead of shuffling the whole pool.
+        pool = np.asarray(booking_ids)
+        booking_ids = list(pool[_NP_RNG.choice(len(pool), size=n_rows, replace=False)])
 
-    status_ci = next((c for c in cols if c.column == (status_col or "")), None)
-    stay_status_choices = enums.get(status_ci.udt_name.lower(), []) if status_ci else []
+    status_ci = spec.by_name.get(status_col) if status_col else None
+    stay_status_choices = enums.get(status_ci.udt_name_lc, []) if status_ci else []
+    status_draws = draw_enum_labels(stay_status_choices, n_rows, False) if stay_status_choices else None
 
     uniq_cols_in_table: Set[str] = set(unique_cols.get(table_lc, set()))
     seen_uniques: Dict[str, Set[Any]] = {c: set() for c in uniq_cols_in_table}
 
-    def _register_unique(col: str, val: Any) -> bool:
-        if val is None:
-            return True
-        s = seen_uniques.get(col)
-        if s is None:
-            return True
-        if val in s:
-            return False
-        s.add(val)
-        return True
-
+    def _ensure_unique(c: ColumnInfo, v: Any, i: int) -> Any:
+        """One regenerate-then-suffix pass for single-column UNIQUE constraints
+        (safe for NULLs)."""
+        seen = seen_uniques.get(c.column)
+        if seen is None or v is None:
+            return v
+        tries = 0
+        while v in seen and tries < 50:
+            tries += 1
+            v = generate_value(fake, c, i + tries, enums)
+        if v in seen:
+            # Force uniqueness deterministically as a last resort
+            if isinstance(v, str):
+                suffix = short_uid()
+                maxlen = c.char_max_len or 255
+                keep = max(1, maxlen - (1 + len(suffix)))
+                v = (str(v)[:keep] + "_" + suffix)[:maxlen]
+            elif isinstance(v, int):
+                v = int(v) + (i * 1000) + tries
+            else:
+                v = f"{v}_{short_uid()}"
+        seen.add(v)
+        return v
+
+
+    # Positional rows: writing through precomputed column indexes skips the
+    # per-row dict build plus the reordering .get() per column at write time.
+    col_pos = spec.col_pos
+    booking_pos = col_pos.get(booking_id_col) if booking_id_col else None
+    status_pos = col_pos.get(status_col) if status_col else None
+    aci_pos = col_pos.get(aci_col) if aci_col else None
+    aco_pos = col_pos.get(aco_col) if aco_col else None
+
+    prefilled: Set[str] = set()
+    if booking_id_col:
+        prefilled.add(booking_id_col)
+    if status_col and status_draws is not None:
+        prefilled.add(status_col)
+    if aci_col:
+        prefilled.add(aci_col)
+    if aco_col:
+        prefilled.add(aco_col)
+    fill_cols = [(col_pos[c.column], c) for c in cols if c.column not in prefilled]
+
+    # Vectorized FK draws: one rng.choice per FK column instead of one
+    # random.choice per row.
+    fk_draws: Dict[str, np.ndarray] = {}
+    for _, c in fill_cols:
+        fk_ref = spec.fk_by_col.get(c.column)
+        if fk_ref is not None:
+            candidates = ref_ids.get(fk_ref[0])
+            if candidates is not None and len(candidates):
+                fk_draws[c.column] = _NP_RNG.choice(candidates, size=n_rows, replace=True)
 
     with path.open("w", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
         w.writerow(colnames)
 
         for i in range(1, n_rows + 1):
-            row: Dict[str, Any] = {}
+            row: List[Any] = [None] * len(cols)
 
-            if booking_id_col:
+            if booking_pos is not None:
                 if is_booking_unique:
-                    row[booking_id_col] = booking_ids[i - 1]
+                    row[booking_pos] = booking_ids[i - 1]
                 else:
-                    row[booking_id_col] = random.choice(booking_ids) if booking_ids else 1
+                    row[booking_pos] = random.choice(booking_ids) if booking_ids else 1
 
             scenario = None
-            if status_col and stay_status_choices:
-                scenario = random.choice(stay_status_choices)
-                row[status_col] = scenario
+            if status_pos is not None and status_draws is not None:
+                scenario = status_draws[i - 1]
+                row[status_pos] = scenario
 
             s = (scenario or "").upper()
             is_cancel = "CANCEL" in s
             is_out = "OUT" in s
             is_in = ("IN" in s) and not is_out
 
-            if is_cancel:
-                if aci_col:
-                    row[aci_col] = None
-                if aco_col:
-                    row[aco_col] = None
-            elif is_out:
+            if is_out:
                 ci = fake.date_time_between(start_date="-180d", end_date="now", tzinfo=timezone.utc)
                 co = ci + timedelta(days=random.randint(1, 10), hours=random.randint(0, 6), minutes=random.randint(0, 59))
-                if aci_col:
-                    row[aci_col] = ci
-                if aco_col:
-                    row[aco_col] = co
-            elif is_in:
+                if aci_pos is not None:
+                    row[aci_pos] = ci
+                if aco_pos is not None:
+                    row[aco_pos] = co
+            elif is_in and not is_cancel:
                 ci = fake.date_time_between(start_date="-180d", end_date="now", tzinfo=timezone.utc)
-                if aci_col:
-                    row[aci_col] = ci
-                if aco_col:
-                    row[aco_col] = None
-            else:
-                if aci_col:
-                    row[aci_col] = None
-                if aco_col:
-                    row[aco_col] = None
-
-            for c in cols:
-                if c.column in row:
+                if aci_pos is not None:
+                    row[aci_pos] = ci
+            # cancelled / other scenarios leave both timestamps at None
+
+            for j, c in fill_cols:
+                if spec.fk_by_col.get(c.column) is not None:
+                    draws = fk_draws.get(c.column)
+                    row[j] = draws[i - 1] if draws is not None else (None if c.is_nullable else 1)
                     continue
-                fk_key = (table_lc, c.column)
-                if fk_key in fk_map:
-                    parent_table, _ = fk_map[fk_key]
-                    candidates = ref_ids.get(parent_table, [])
-                    row[c.column] = random.choice(candidates) if candidates else (None if c.is_nullable else 1)
-                else:
-                    v = generate_value(fake, c, i, enums)
-
-                # Enforce single-column UNIQUE constraints (safe for NULLs)
-                if c.column in seen_uniques and v is not None:
-                    tries = 0
-                    max_tries = 50
-                    while v in seen_uniques[c.column] and tries < max_tries:
-                        tries += 1
-                        v = generate_value(fake, c, i + tries, enums)
-
-                    if v in seen_uniques[c.column]:
-                        # Force uniqueness deterministically as a last resort
-                        if isinstance(v, str):
-                            suffix = uuid.uuid4().hex[:6]
-                            maxlen = c.character_maximum_length or 255
-                            keep = max(1, maxlen - (1 + len(suffix)))
-                            v = (str(v)[:keep] + "_" + suffix)[:maxlen]
-                        elif isinstance(v, int):
-                            v = int(v) + (i * 1000) + tries
-                        else:
-                            v = f"{v}_{uuid.uuid4().hex[:6]}"
-
-                    seen_uniques[c.column].add(v)
+
+                v = generate_value(fake, c, i, enums)
                 if v is None and not c.is_nullable:
-                    if c.data_type.lower() in {"character varying", "character", "text"}:
-                        v = unique_text((c.table, c.column), lambda: f"VAL_{uuid.uuid4().hex[:6]}")
-                    elif c.data_type.lower() in {"integer", "bigint", "smallint"}:
+                    if c.data_type_lc in {"character varying", "character", "text"}:
+                        v = unique_text((c.table, c.column), lambda: f"VAL_{short_uid()}")
+                    elif c.data_type_lc in {"integer", "bigint", "smallint"}:
                         v = 1
-                    elif c.data_type.lower() == "boolean":
+                    elif c.data_type_lc == "boolean":
                         v = False
-                    elif c.data_type.lower() == "date":
+                    elif c.data_type_lc == "date":
                         v = date.today()
                     else:
                         v = "VAL"
 
-                # Enforce UNIQUE(column) constraints (single-column) to prevent COPY UniqueViolation
-                if c.column in uniq_cols_in_table:
-                    # Try a few regenerations before forcing uniqueness
-                    for _ in range(50):
-                        if _register_unique(c.column, v):
-                            break
-                        v = generate_value(fake, c, i, enums)
-
-                # Enforce single-column UNIQUE constraints (safe for NULLs)
-                if c.column in seen_uniques and v is not None:
-                    tries = 0
-                    max_tries = 50
-                    while v in seen_uniques[c.column] and tries < max_tries:
-                        tries += 1
-                        v = generate_value(fake, c, i + tries, enums)
-
-                    if v in seen_uniques[c.column]:
-                        # Force uniqueness deterministically as a last resort
-                        if isinstance(v, str):
-                            suffix = uuid.uuid4().hex[:6]
-                            maxlen = c.character_maximum_length or 255
-                            keep = max(1, maxlen - (1 + len(suffix)))
-                            v = (str(v)[:keep] + "_" + suffix)[:maxlen]
-                        elif isinstance(v, int):
-                            v = int(v) + (i * 1000) + tries
-                        else:
-                            v = f"{v}_{uuid.uuid4().hex[:6]}"
-
-                    seen_uniques[c.column].add(v)
-
-                row[c.column] = v
-
-            if aci_col and aco_col:
-                ci = row.get(aci_col)
-                co = row.get(aco_col)
+                row[j] = _ensure_unique(c, v, i)
+
+            if aci_pos is not None and aco_pos is not None:
+                ci = row[aci_pos]
+                co = row[aco_pos]
                 if ci is not None and co is not None and co < ci:
-                    row[aco_col] = ci + timedelta(days=1)
+                    row[aco_pos] = ci + timedelta(days=1)
 
-            w.writerow([row.get(cn) for cn in colnames])
+            w.writerow(row)
 
     return path
 
@@ -896,7 +1270,7 @@ def generate_booking_discount_csv(
     table: str,
     cols: List[ColumnInfo],
     fk_map: Dict[Tuple[str, str], Tuple[str, str]],
-    ref_ids: Dict[str, List[Any]],
+    ref_ids: Dict[str, np.ndarray],
     n_rows: int,
     enums: Dict[str, List[str]],
 ) -> Path:
@@ -906,9 +1280,10 @@ def generate_booking_discount_csv(
     """
     out_dir.mkdir(parents=True, exist_ok=True)
     path = out_dir / f"{table}.csv"
-    colnames = [c.column for c in cols]
-    col_lc = {c.column.lower(): c.column for c in cols}
-    table_lc = table.lower()
+    spec = table_spec(table, cols, fk_map)
+    colnames = list(spec.colnames)
+    col_lc = spec.col_lc
+    table_lc = spec.table_lc
 
     booking_id_col = col_lc.get("booking_id")
     promo_id_col = col_lc.get("promotion_id") or col_lc.get("promo_id")
@@ -916,93 +1291,31 @@ def generate_booking_discount_csv(
     if not booking_id_col or not promo_id_col:
         raise RuntimeError("booking_discount expected booking_id and promotion_id columns.")
 
-    booking_ids = list(ref_ids.get("booking", []))
-    promo_ids = list(ref_ids.get("promotion", []))
+    booking_ids = np.asarray(ref_ids.get("booking", []))
+    promo_ids = np.asarray(ref_ids.get("promotion", []))
 
-    if not booking_ids or not promo_ids:
+    if not len(booking_ids) or not len(promo_ids):
         raise RuntimeError("booking_discount needs booking + promotion ids loaded first.")
 
-    seen: set[tuple[Any, Any]] = set()
-    rows: List[Dict[str, Any]] = []
-
-    random.shuffle(booking_ids)
-
     max_pairs = len(booking_ids) * len(promo_ids)
     if n_rows > max_pairs:
         raise RuntimeError(
             f"Requested {n_rows} booking_discount rows but only {max_pairs} unique (booking_id,promotion_id) pairs exist."
         )
 
-    i = 0
-    while len(rows) < n_rows:
-        b = booking_ids[i % len(booking_ids)]
-        promos_for_booking = random.randint(0, 2)
-        if promos_for_booking == 0:
-            i += 1
-            continue
+    # UNIQUE(booking_id, promotion_id): batched index-pair draws, deduped in one pass.
+    b_idx, p_idx = _unique_index_pairs(len(booking_ids), len(promo_ids), n_rows)
+    n = len(b_idx)
 
-        for _ in range(promos_for_booking):
-            p = random.choice(promo_ids)
-            pair = (b, p)
-            if pair in seen:
-                continue
-            seen.add(pair)
-
-            row: Dict[str, Any] = {booking_id_col: b, promo_id_col: p}
-
-            for c in cols:
-                if c.column in row:
-                    continue
-                fk_key = (table_lc, c.column)
-                if fk_key in fk_map:
-                    parent_table, _ = fk_map[fk_key]
-                    candidates = ref_ids.get(parent_table, [])
-                    row[c.column] = random.choice(candidates) if candidates else (None if c.is_nullable else 1)
-                else:
-                    v = generate_value(fake, c, len(rows) + 1, enums)
-                    if v is None and not c.is_nullable:
-                        v = 1 if c.data_type.lower() in {"integer", "bigint", "smallint"} else f"VAL_{uuid.uuid4().hex[:6]}"
-                    row[c.column] = v
-
-            rows.append(row)
-            if len(rows) >= n_rows:
-                break
-
-        i += 1
-
-        if i > n_rows * 20 and len(rows) < n_rows:
-            for b2 in booking_ids:
-                for p2 in promo_ids:
-                    if len(rows) >= n_rows:
-                        break
-                    pair = (b2, p2)
-                    if pair in seen:
-                        continue
-                    seen.add(pair)
-                    row = {booking_id_col: b2, promo_id_col: p2}
-                    for c in cols:
-                        if c.column in row:
-                            continue
-                        fk_key = (table_lc, c.column)
-                        if fk_key in fk_map:
-                            parent_table, _ = fk_map[fk_key]
-                            candidates = ref_ids.get(parent_table, [])
-                            row[c.column] = random.choice(candidates) if candidates else (None if c.is_nullable else 1)
-                        else:
-                            v = generate_value(fake, c, len(rows) + 1, enums)
-                            if v is None and not c.is_nullable:
-                                v = 1 if c.data_type.lower() in {"integer", "bigint", "smallint"} else f"VAL_{uuid.uuid4().hex[:6]}"
-                            row[c.column] = v
-                    rows.append(row)
-                if len(rows) >= n_rows:
-                    break
-
-    with path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        w.writerow(colnames)
-        for row in rows[:n_rows]:
-            w.writerow([row.get(cn) for cn in colnames])
+    columns: Dict[str, List[Any]] = {
+        booking_id_col: list(booking_ids[b_idx]),
+        promo_id_col: list(promo_ids[p_idx]),
+    }
+    _fill_generic_columns(
+        fake=fake, table_lc=table_lc, cols=cols, fk_map=fk_map, ref_ids=ref_ids, enums=enums, columns=columns, n=n
+    )
 
+    _write_columns_csv(path, colnames, columns)
     return path
 
 
@@ -1013,7 +1326,7 @@ def generate_review_score_csv(
     table: str,
     cols: List[ColumnInfo],
     fk_map: Dict[Tuple[str, str], Tuple[str, str]],
-    ref_ids: Dict[str, List[Any]],
+    ref_ids: Dict[str, np.ndarray],
     n_rows: int,
     enums: Dict[str, List[str]],
 ) -> Path:
@@ -1023,9 +1336,10 @@ def generate_review_score_csv(
     """
     out_dir.mkdir(parents=True, exist_ok=True)
     path = out_dir / f"{table}.csv"
-    colnames = [c.column for c in cols]
-    col_lc = {c.column.lower(): c.column for c in cols}
-    table_lc = table.lower()
+    spec = table_spec(table, cols, fk_map)
+    colnames = list(spec.colnames)
+    col_lc = spec.col_lc
+    table_lc = spec.table_lc
 
     review_id_col = col_lc.get("review_id")
     category_id_col = col_lc.get("review_category_id") or col_lc.get("category_id")
@@ -1033,10 +1347,10 @@ def generate_review_score_csv(
     if not review_id_col or not category_id_col:
         raise RuntimeError("review_score expected review_id and review_category_id columns.")
 
-    review_ids = list(ref_ids.get("review", []))
-    category_ids = list(ref_ids.get("review_category", []))
+    review_ids = np.asarray(ref_ids.get("review", []))
+    category_ids = np.asarray(ref_ids.get("review_category", []))
 
-    if not review_ids or not category_ids:
+    if not len(review_ids) or not len(category_ids):
         raise RuntimeError("review_score needs review + review_category ids loaded first.")
 
     # Cap to maximum unique pairs available
@@ -1046,79 +1360,28 @@ def generate_review_score_csv(
             f"Requested {n_rows} review_score rows but only {max_pairs} unique (review_id,review_category_id) pairs exist."
         )
 
-    seen: set[tuple[Any, Any]] = set()
-    rows: List[Dict[str, Any]] = []
-
-    # Generate by sampling categories per review without replacement to guarantee uniqueness.
-    random.shuffle(review_ids)
-    i = 0
-    while len(rows) < n_rows:
-        rid = review_ids[i % len(review_ids)]
-        # 1-5 categories per review (bounded by available categories)
-        k = random.randint(1, min(5, len(category_ids)))
-        for cid in random.sample(category_ids, k=k):
-            if len(rows) >= n_rows:
-                break
-            pair = (rid, cid)
-            if pair in seen:
-                continue
-            seen.add(pair)
-
-            row: Dict[str, Any] = {review_id_col: rid, category_id_col: cid}
-
-            for c in cols:
-                if c.column in row:
-                    continue
-                fk_key = (table_lc, c.column)
-                if fk_key in fk_map:
-                    parent_table, _ = fk_map[fk_key]
-                    candidates = ref_ids.get(parent_table, [])
-                    row[c.column] = random.choice(candidates) if candidates else (None if c.is_nullable else 1)
-                else:
-                    v = generate_value(fake, c, len(rows) + 1, enums)
-                    if v is None and not c.is_nullable:
-                        v = 1 if c.data_type.lower() in {"integer", "bigint", "smallint"} else f"VAL_{uuid.uuid4().hex[:6]}"
-                    row[c.column] = v
-
-            rows.append(row)
-
-        i += 1
-
-        # Fallback: if somehow not enough rows (very unlikely), fill deterministically over the cartesian product
-        if i > n_rows * 10 and len(rows) < n_rows:
-            for rid2 in review_ids:
-                for cid2 in category_ids:
-                    if len(rows) >= n_rows:
-                        break
-                    pair = (rid2, cid2)
-                    if pair in seen:
-                        continue
-                    seen.add(pair)
-                    row = {review_id_col: rid2, category_id_col: cid2}
-                    for c in cols:
-                        if c.column in row:
-                            continue
-                        fk_key = (table_lc, c.column)
-                        if fk_key in fk_map:
-                            parent_table, _ = fk_map[fk_key]
-                            candidates = ref_ids.get(parent_table, [])
-                            row[c.column] = random.choice(candidates) if candidates else (None if c.is_nullable else 1)
-                        else:
-                            v = generate_value(fake, c, len(rows) + 1, enums)
-                            if v is None and not c.is_nullable:
-                                v = 1 if c.data_type.lower() in {"integer", "bigint", "smallint"} else f"VAL_{uuid.uuid4().hex[:6]}"
-                            row[c.column] = v
-                    rows.append(row)
-                if len(rows) >= n_rows:
-                    break
-            break
-
-    with path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        w.writerow(colnames)
-        for r in rows:
-            w.writerow([r.get(cn) for cn in colnames])
-
+    # Sample unique (review, category) index pairs in one shot; uniqueness is
+    # guaranteed up front, so no seen-set rejection loop or cartesian fallback.
+    r_idx, c_idx = _unique_index_pairs(len(review_ids), len(category_ids), n_rows)
+    n = len(r_idx)
+
+    columns: Dict[str, List[Any]] = {
+        review_id_col: list(review_ids[r_idx]),
+        category_id_col: list(category_ids[c_idx]),
+    }
+
+    _fill_generic_columns(
+        fake=fake,
+        table_lc=table_lc,
+        cols=cols,
+        fk_map=fk_map,
+        ref_ids=ref_ids,
+        enums=enums,
+        columns=columns,
+        n=n,
+    )
+
+    _write_columns_csv(path, colnames, columns)
     return path
 
 
@@ -1130,7 +1393,7 @@ def generate_booking_csv(
     table: str,
     cols: List[ColumnInfo],
     fk_map: Dict[Tuple[str, str], Tuple[str, str]],
-    ref_ids: Dict[str, List[Any]],
+    ref_ids: Dict[str, np.ndarray],
     n_rows: int,
     enums: Dict[str, List[str]],
     unique_cols: Dict[str, Set[str]],
@@ -1143,9 +1406,10 @@ def generate_booking_csv(
     """
     out_dir.mkdir(parents=True, exist_ok=True)
     path = out_dir / f"{table}.csv"
-    colnames = [c.column for c in cols]
-    col_lc = {c.column.lower(): c.column for c in cols}
-    table_lc = table.lower()
+    spec = table_spec(table, cols, fk_map, unique_cols)
+    colnames = list(spec.colnames)
+    col_lc = spec.col_lc
+    table_lc = spec.table_lc
 
     checkin_col = col_lc.get("checkin_date")
     checkout_col = col_lc.get("checkout_date")
@@ -1154,130 +1418,136 @@ def generate_booking_csv(
     pk_col = pk.columns[0] if (pk and len(pk.columns) == 1) else None
     pk_vals: List[Any] = []
 
-    status_ci = next((c for c in cols if c.column == (status_col or "")), None)
-    booking_status_choices = enums.get(status_ci.udt_name.lower(), []) if status_ci else []
+    status_ci = spec.by_name.get(status_col) if status_col else None
+    booking_status_choices = enums.get(status_ci.udt_name_lc, []) if status_ci else []
+    status_draws = draw_enum_labels(booking_status_choices, n_rows, False) if booking_status_choices else None
 
-    fk_cols_in_table = {c.column for c in cols if (table_lc, c.column) in fk_map}
+    fk_cols_in_table = {c.column for c in cols if spec.fk_by_col.get(c.column) is not None}
     uniq_cols_in_table = unique_cols.get(table_lc, set())
     unique_fk_cols = fk_cols_in_table.intersection(uniq_cols_in_table)
 
     unique_fk_pools: Dict[str, List[Any]] = {}
     for fk_col in unique_fk_cols:
-        parent_table, _ = fk_map[(table_lc, fk_col)]
-        parent_ids = list(ref_ids.get(parent_table, []))
-        random.shuffle(parent_ids)
-        unique_fk_pools[fk_col] = parent_ids[:n_rows]
+        parent_table, _ = spec.fk_by_col[fk_col]
+        parent_ids = np.asarray(ref_ids.get(parent_table, []))
+        if not len(parent_ids):
+            unique_fk_pools[fk_col] = []
+            continue
+        # Sample without replacement instead of copy + full shuffle + slice:
+        # O(n_rows) work even when the parent pool is much larger.
+        k = min(n_rows, len(parent_ids))
+        idx = _NP_RNG.choice(len(parent_ids), size=k, replace=False)
+        unique_fk_pools[fk_col] = list(parent_ids[idx])
+
+    # Vectorized FK draws: one rng.choice per FK column instead of one
+    # random.choice per row.
+    fk_draws: Dict[str, np.ndarray] = {}
+    for c in cols:
+        fk_ref = spec.fk_by_col.get(c.column)
+        if fk_ref is not None and c.column not in unique_fk_pools:
+            parent_table, _ = fk_ref
+            candidates = ref_ids.get(parent_table)
+            if candidates is not None and len(candidates):
+                fk_draws[c.column] = _NP_RNG.choice(candidates, size=n_rows, replace=True)
 
     # Track seen values for single-column UNIQUE constraints
     seen_uniques: Dict[str, Set[Any]] = {c: set() for c in uniq_cols_in_table}
 
-
-
-    with path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        w.writerow(colnames)
-
+    def _ensure_unique(c: ColumnInfo, v: Any, i: int) -> Any:
+        """One regenerate-then-suffix pass for single-column UNIQUE constraints
+        (safe for NULLs)."""
+        seen = seen_uniques.get(c.column)
+        if seen is None or v is None:
+            return v
+        tries = 0
+        while v in seen and tries < 50:
+            tries += 1
+            v = generate_value(fake, c, i + tries, enums)
+        if v in seen:
+            # Force uniqueness deterministically as a last resort
+            if isinstance(v, str):
+                suffix = short_uid()
+                maxlen = c.char_max_len or 255
+                keep = max(1, maxlen - (1 + len(suffix)))
+                v = (str(v)[:keep] + "_" + suffix)[:maxlen]
+            elif isinstance(v, int):
+                v = int(v) + (i * 1000) + tries
+            else:
+                v = f"{v}_{short_uid()}"
+        seen.add(v)
+        return v
+
+    # Column buffers (SoA): status and FK columns are whole-column fills; the
+    # remaining columns are filled by index in the row loop below.
+    col_buffers: Dict[str, List[Any]] = {}
+    if status_col and status_draws is not None:
+        col_buffers[status_col] = list(status_draws)
+    for c in cols:
+        if c.column in col_buffers or spec.fk_by_col.get(c.column) is None:
+            continue
+        if c.column in unique_fk_pools and unique_fk_pools[c.column]:
+            pool = unique_fk_pools[c.column]
+            pad = None if c.is_nullable else pool[-1]
+            col_buffers[c.column] = [pool[k] if k < len(pool) else pad for k in range(n_rows)]
+        else:
+            draws = fk_draws.get(c.column)
+            if draws is not None:
+                col_buffers[c.column] = list(draws)
+            else:
+                col_buffers[c.column] = [None if c.is_nullable else 1] * n_rows
+
+    if checkin_col and checkout_col:
+        # Both dates for the whole table in two vectorized draws; checkout is
+        # checkin plus at least one day, so ordering holds by construction.
+        base = np.datetime64(date.today())
+        start_off = _NP_RNG.integers(-180, 366, size=n_rows)
+        stay_len = _NP_RNG.integers(1, 15, size=n_rows)
+        col_buffers[checkin_col] = (base + start_off.astype("timedelta64[D]")).tolist()
+        col_buffers[checkout_col] = (base + (start_off + stay_len).astype("timedelta64[D]")).tolist()
+
+    # Int/numeric/boolean columns: one vectorized draw each. PK and UNIQUE
+    # columns stay on the per-row path (pk_vals tracking, _ensure_unique).
+    for c in cols:
+        if c.column in col_buffers or c.column == pk_col or c.column in seen_uniques:
+            continue
+        bulk = bulk_numeric_fill(c, n_rows)
+        if bulk is not None:
+            col_buffers[c.column] = bulk
+
+    fill_cols = [c for c in cols if c.column not in col_buffers]
+    for c in fill_cols:
+        col_buffers[c.column] = [None] * n_rows
+
+    # Column-major fill: bind the generator closure, buffer, and column
+    # metadata to locals once per column so the inner loop runs on LOAD_FAST
+    # instead of repeated dict/attribute lookups per cell.
+    for c in fill_cols:
+        gen = column_generator(fake, c, enums)
+        buf = col_buffers[c.column]
+        not_null = not c.is_nullable
+        dtype_lc = c.data_type_lc
+        ensure = _ensure_unique if c.column in seen_uniques else None
+        is_pk = c.column == pk_col
         for i in range(1, n_rows + 1):
-            row: Dict[str, Any] = {}
-
-            if status_col and booking_status_choices:
-                row[status_col] = random.choice(booking_status_choices)
-
-            if checkin_col and checkout_col:
-                ci = fake.date_between(start_date="-180d", end_date="+365d")
-                co = ci + timedelta(days=random.randint(1, 14))
-                row[checkin_col] = ci
-                row[checkout_col] = co
-
-            for c in cols:
-                if c.column in row:
-                    continue
-
-                if pk_col and c.column == pk_col:
-                    v = generate_value(fake, c, i, enums)
-
-                # Enforce single-column UNIQUE constraints (safe for NULLs)
-                if c.column in seen_uniques and v is not None:
-                    tries = 0
-                    max_tries = 50
-                    while v in seen_uniques[c.column] and tries < max_tries:
-                        tries += 1
-                        v = generate_value(fake, c, i + tries, enums)
-
-                    if v in seen_uniques[c.column]:
-                        # Force uniqueness deterministically as a last resort
-                        if isinstance(v, str):
-                            suffix = uuid.uuid4().hex[:6]
-                            maxlen = c.character_maximum_length or 255
-                            keep = max(1, maxlen - (1 + len(suffix)))
-                            v = (str(v)[:keep] + "_" + suffix)[:maxlen]
-                        elif isinstance(v, int):
-                            v = int(v) + (i * 1000) + tries
-                        else:
-                            v = f"{v}_{uuid.uuid4().hex[:6]}"
-
-                    seen_uniques[c.column].add(v)
-                    row[c.column] = v
-                    pk_vals.append(v)
-                    continue
-
-                fk_key = (table_lc, c.column)
-                if fk_key in fk_map:
-                    parent_table, _ = fk_map[fk_key]
-                    if c.column in unique_fk_pools and unique_fk_pools[c.column]:
-                        idx = i - 1
-                        row[c.column] = unique_fk_pools[c.column][idx] if idx < len(unique_fk_pools[c.column]) else (
-                            None if c.is_nullable else unique_fk_pools[c.column][-1]
-                        )
-                        continue
-
-                    candidates = ref_ids.get(parent_table, [])
-                    row[c.column] = random.choice(candidates) if candidates else (None if c.is_nullable else 1)
-                    continue
-
-                v = generate_value(fake, c, i, enums)
-
-                # Enforce single-column UNIQUE constraints (safe for NULLs)
-                if c.column in seen_uniques and v is not None:
-                    tries = 0
-                    max_tries = 50
-                    while v in seen_uniques[c.column] and tries < max_tries:
-                        tries += 1
-                        v = generate_value(fake, c, i + tries, enums)
-
-                    if v in seen_uniques[c.column]:
-                        # Force uniqueness deterministically as a last resort
-                        if isinstance(v, str):
-                            suffix = uuid.uuid4().hex[:6]
-                            maxlen = c.character_maximum_length or 255
-                            keep = max(1, maxlen - (1 + len(suffix)))
-                            v = (str(v)[:keep] + "_" + suffix)[:maxlen]
-                        elif isinstance(v, int):
-                            v = int(v) + (i * 1000) + tries
-                        else:
-                            v = f"{v}_{uuid.uuid4().hex[:6]}"
-
-                    seen_uniques[c.column].add(v)
-                if v is None and not c.is_nullable:
-                    if c.data_type.lower() in {"character varying", "character", "text"}:
-                        v = unique_text((c.table, c.column), lambda: f"VAL_{uuid.uuid4().hex[:6]}")
-                    elif c.data_type.lower() in {"integer", "bigint", "smallint"}:
-                        v = 1
-                    elif c.data_type.lower() == "boolean":
-                        v = False
-                    elif c.data_type.lower() == "date":
-                        v = date.today()
-                    else:
-                        v = "VAL"
-                row[c.column] = v
-
-            if checkin_col and checkout_col:
-                ci = row.get(checkin_col)
-                co = row.get(checkout_col)
-                if ci is not None and co is not None and co < ci:
-                    row[checkout_col] = ci + timedelta(days=1)
+            v = gen(i)
+            if ensure is not None:
+                v = ensure(c, v, i)
+            if v is None and not_null:
+                if dtype_lc in {"character varying", "character", "text"}:
+                    v = unique_text((c.table, c.column), lambda: f"VAL_{short_uid()}")
+                elif dtype_lc in {"integer", "bigint", "smallint"}:
+                    v = 1
+                elif dtype_lc == "boolean":
+                    v = False
+                elif dtype_lc == "date":
+                    v = date.today()
+                else:
+                    v = "VAL"
+            buf[i - 1] = v
+            if is_pk:
+                pk_vals.append(v)
 
-            w.writerow([row.get(cn) for cn in colnames])
+    _write_columns_csv(path, colnames, col_buffers)
 
     # NOTE: we still track pk_vals here, but the main loop will overwrite with DB-truth anyway.
     if pk_col:
@@ -1296,7 +1566,7 @@ def generate_table_csv(
     cols: List[ColumnInfo],
     pk: Optional[PrimaryKey],
     fk_map: Dict[Tuple[str, str], Tuple[str, str]],
-    ref_ids: Dict[str, List[Any]],
+    ref_ids: Dict[str, np.ndarray],
     n_rows: int,
     enums: Dict[str, List[str]],
     unique_cols: Dict[str, Set[str]],
@@ -1362,135 +1632,157 @@ def generate_table_csv(
 
     out_dir.mkdir(parents=True, exist_ok=True)
     path = out_dir / f"{table}.csv"
-    colnames = [c.column for c in cols]
-    table_lc = table.lower()
+    spec = table_spec(table, cols, fk_map, unique_cols)
+    colnames = list(spec.colnames)
+    table_lc = spec.table_lc
 
     pk_col = pk.columns[0] if (pk and len(pk.columns) == 1) else None
     pk_vals: List[Any] = []
 
     # UNIQUE(FK) auto-detection for 1:1 tables
-    fk_cols_in_table = {c.column for c in cols if (table_lc, c.column) in fk_map}
+    fk_cols_in_table = {c.column for c in cols if spec.fk_by_col.get(c.column) is not None}
     uniq_cols_in_table = unique_cols.get(table_lc, set())
     unique_fk_cols = fk_cols_in_table.intersection(uniq_cols_in_table)
 
     unique_fk_pools: Dict[str, List[Any]] = {}
     for fk_col in unique_fk_cols:
-        parent_table, _ = fk_map[(table_lc, fk_col)]
-        parent_ids = list(ref_ids.get(parent_table, []))
-        random.shuffle(parent_ids)
-        unique_fk_pools[fk_col] = parent_ids[:n_rows]
+        parent_table, _ = spec.fk_by_col[fk_col]
+        parent_ids = np.asarray(ref_ids.get(parent_table, []))
+        if not len(parent_ids):
+            unique_fk_pools[fk_col] = []
+            continue
+        # Sample without replacement instead of copy + full shuffle + slice:
+        # O(n_rows) work even when the parent pool is much larger.
+        k = min(n_rows, len(parent_ids))
+        idx = _NP_RNG.choice(len(parent_ids), size=k, replace=False)
+        unique_fk_pools[fk_col] = list(parent_ids[idx])
+
+    # Vectorized FK draws: one rng.choice per FK column instead of one
+    # random.choice per row.
+    fk_draws: Dict[str, np.ndarray] = {}
+    for c in cols:
+        fk_ref = spec.fk_by_col.get(c.column)
+        if fk_ref is not None and c.column not in unique_fk_pools:
+            parent_table, _ = fk_ref
+            candidates = ref_ids.get(parent_table)
+            if candidates is not None and len(candidates):
+                fk_draws[c.column] = _NP_RNG.choice(candidates, size=n_rows, replace=True)
+
+    # Enum columns: one batched label draw per column instead of a per-row
+    # random.choice inside generate_value.
+    enum_draws: Dict[str, np.ndarray] = {}
+    for c in cols:
+        labels = enums.get(c.udt_name_lc)
+        if labels and (table_lc, c.column) not in fk_map:
+            enum_draws[c.column] = draw_enum_labels(labels, n_rows, c.is_nullable)
 
     # Track seen values for single-column UNIQUE constraints
     seen_uniques: Dict[str, Set[Any]] = {c: set() for c in uniq_cols_in_table}
 
-    with path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        w.writerow(colnames)
-
-        # Start/end date coherence (generic)
-        col_lc = {c.column.lower(): c.column for c in cols}
-        start_keys = {"start_date", "from_date", "valid_from", "effective_start_date", "block_start_date"}
-        end_keys = {"end_date", "to_date", "valid_to", "effective_end_date", "block_end_date", "expires_on"}
-
-        start_col = next((col_lc[k] for k in start_keys if k in col_lc), None)
-        end_col = next((col_lc[k] for k in end_keys if k in col_lc), None)
-
+    def _ensure_unique(c: ColumnInfo, v: Any, i: int) -> Any:
+        """One regenerate-then-suffix pass for single-column UNIQUE constraints
+        (safe for NULLs)."""
+        seen = seen_uniques.get(c.column)
+        if seen is None or v is None:
+            return v
+        tries = 0
+        while v in seen and tries < 50:
+            tries += 1
+            v = generate_value(fake, c, i + tries, enums)
+        if v in seen:
+            # Force uniqueness deterministically as a last resort
+            if isinstance(v, str):
+                suffix = short_uid()
+                maxlen = c.char_max_len or 255
+                keep = max(1, maxlen - (1 + len(suffix)))
+                v = (str(v)[:keep] + "_" + suffix)[:maxlen]
+            elif isinstance(v, int):
+                v = int(v) + (i * 1000) + tries
+            else:
+                v = f"{v}_{short_uid()}"
+        seen.add(v)
+        return v
+
+    # Start/end date coherence (generic)
+    col_lc = spec.col_lc
+    start_keys = {"start_date", "from_date", "valid_from", "effective_start_date", "block_start_date"}
+    end_keys = {"end_date", "to_date", "valid_to", "effective_end_date", "block_end_date", "expires_on"}
+
+    start_col = next((col_lc[k] for k in start_keys if k in col_lc), None)
+    end_col = next((col_lc[k] for k in end_keys if k in col_lc), None)
+
+    # Column buffers (SoA): enum and FK columns are whole-column fills; the
+    # remaining columns are filled by index in the row loop below.
+    col_buffers: Dict[str, List[Any]] = {}
+    for col, draws in enum_draws.items():
+        col_buffers[col] = list(draws)
+    for c in cols:
+        if c.column in col_buffers or spec.fk_by_col.get(c.column) is None:
+            continue
+        # UNIQUE(FK): assign without replacement
+        if c.column in unique_fk_pools and unique_fk_pools[c.column]:
+            pool = unique_fk_pools[c.column]
+            pad = None if c.is_nullable else pool[-1]
+            col_buffers[c.column] = [pool[k] if k < len(pool) else pad for k in range(n_rows)]
+        else:
+            draws = fk_draws.get(c.column)
+            if draws is not None:
+                col_buffers[c.column] = list(draws)
+            else:
+                col_buffers[c.column] = [None if c.is_nullable else 1] * n_rows
+
+    if start_col and end_col:
+        # Both dates for the whole table in two vectorized draws; the end date
+        # is start plus a positive span, so ordering holds by construction.
+        base = np.datetime64(date.today())
+        start_off = _NP_RNG.integers(-365, 366, size=n_rows)
+        span = _NP_RNG.integers(1, 61, size=n_rows)
+        col_buffers[start_col] = (base + start_off.astype("timedelta64[D]")).tolist()
+        col_buffers[end_col] = (base + (start_off + span).astype("timedelta64[D]")).tolist()
+
+    # Int/numeric/boolean columns: one vectorized draw each. PK and UNIQUE
+    # columns stay on the per-row path (pk_vals tracking, _ensure_unique).
+    for c in cols:
+        if c.column in col_buffers or c.column == pk_col or c.column in seen_uniques:
+            continue
+        bulk = bulk_numeric_fill(c, n_rows)
+        if bulk is not None:
+            col_buffers[c.column] = bulk
+
+    fill_cols = [c for c in cols if c.column not in col_buffers]
+    for c in fill_cols:
+        col_buffers[c.column] = [None] * n_rows
+
+    # Column-major fill: bind the generator closure, buffer, and column
+    # metadata to locals once per column so the inner loop runs on LOAD_FAST
+    # instead of repeated dict/attribute lookups per cell.
+    for c in fill_cols:
+        gen = column_generator(fake, c, enums)
+        buf = col_buffers[c.column]
+        not_null = not c.is_nullable
+        dtype_lc = c.data_type_lc
+        ensure = _ensure_unique if c.column in seen_uniques else None
+        is_pk = c.column == pk_col
         for i in range(1, n_rows + 1):
-            row: Dict[str, Any] = {}
-
-            if start_col and end_col:
-                d_from = fake.date_between(start_date="-365d", end_date="+365d")
-                d_to = d_from + timedelta(days=random.randint(1, 60))
-                row[start_col] = d_from
-                row[end_col] = d_to
-
-            for c in cols:
-                if c.column in row:
-                    continue
-
-                # PK
-                if pk_col and c.column == pk_col:
-                    v = generate_value(fake, c, i, enums)
-
-                # Enforce single-column UNIQUE constraints (safe for NULLs)
-                if c.column in seen_uniques and v is not None:
-                    tries = 0
-                    max_tries = 50
-                    while v in seen_uniques[c.column] and tries < max_tries:
-                        tries += 1
-                        v = generate_value(fake, c, i + tries, enums)
-
-                    if v in seen_uniques[c.column]:
-                        # Force uniqueness deterministically as a last resort
-                        if isinstance(v, str):
-                            suffix = uuid.uuid4().hex[:6]
-                            maxlen = c.character_maximum_length or 255
-                            keep = max(1, maxlen - (1 + len(suffix)))
-                            v = (str(v)[:keep] + "_" + suffix)[:maxlen]
-                        elif isinstance(v, int):
-                            v = int(v) + (i * 1000) + tries
-                        else:
-                            v = f"{v}_{uuid.uuid4().hex[:6]}"
-
-                    seen_uniques[c.column].add(v)
-                    row[c.column] = v
-                    pk_vals.append(v)
-                    continue
-
-                # FK
-                fk_key = (table_lc, c.column)
-                if fk_key in fk_map:
-                    parent_table, _ = fk_map[fk_key]
-
-                    # UNIQUE(FK): assign without replacement
-                    if c.column in unique_fk_pools and unique_fk_pools[c.column]:
-                        idx = i - 1
-                        row[c.column] = unique_fk_pools[c.column][idx] if idx < len(unique_fk_pools[c.column]) else (
-                            None if c.is_nullable else unique_fk_pools[c.column][-1]
-                        )
-                        continue
-
-                    candidates = ref_ids.get(parent_table, [])
-                    row[c.column] = random.choice(candidates) if candidates else (None if c.is_nullable else 1)
-                    continue
-
-                v = generate_value(fake, c, i, enums)
-
-                # Enforce single-column UNIQUE constraints (safe for NULLs)
-                if c.column in seen_uniques and v is not None:
-                    tries = 0
-                    max_tries = 50
-                    while v in seen_uniques[c.column] and tries < max_tries:
-                        tries += 1
-                        v = generate_value(fake, c, i + tries, enums)
-
-                    if v in seen_uniques[c.column]:
-                        # Force uniqueness deterministically as a last resort
-                        if isinstance(v, str):
-                            suffix = uuid.uuid4().hex[:6]
-                            maxlen = c.character_maximum_length or 255
-                            keep = max(1, maxlen - (1 + len(suffix)))
-                            v = (str(v)[:keep] + "_" + suffix)[:maxlen]
-                        elif isinstance(v, int):
-                            v = int(v) + (i * 1000) + tries
-                        else:
-                            v = f"{v}_{uuid.uuid4().hex[:6]}"
-
-                    seen_uniques[c.column].add(v)
-                if v is None and not c.is_nullable:
-                    if c.data_type.lower() in {"character varying", "character", "text"}:
-                        v = unique_text((c.table, c.column), lambda: f"VAL_{uuid.uuid4().hex[:6]}")
-                    elif c.data_type.lower() in {"integer", "bigint", "smallint"}:
-                        v = 1
-                    elif c.data_type.lower() == "boolean":
-                        v = False
-                    elif c.data_type.lower() == "date":
-                        v = date.today()
-                    else:
-                        v = "VAL"
-                row[c.column] = v
+            v = gen(i)
+            if ensure is not None:
+                v = ensure(c, v, i)
+            if v is None and not_null:
+                if dtype_lc in {"character varying", "character", "text"}:
+                    v = unique_text((c.table, c.column), lambda: f"VAL_{short_uid()}")
+                elif dtype_lc in {"integer", "bigint", "smallint"}:
+                    v = 1
+                elif dtype_lc == "boolean":
+                    v = False
+                elif dtype_lc == "date":
+                    v = date.today()
+                else:
+                    v = "VAL"
+            buf[i - 1] = v
+            if is_pk:
+                pk_vals.append(v)
 
-            w.writerow([row.get(cn) for cn in colnames])
+    _write_columns_csv(path, colnames, col_buffers)
 
     # NOTE: main loop overwrites with DB-truth anyway.
     if pk_col:
@@ -1502,15 +1794,24 @@ def generate_table_csv(
 # -------------------------
 # COPY load + TRUNCATE + PK cache
 # -------------------------
+# COPY stream buffer: 1 MiB reads keep the server fed without buffering whole tables.
+COPY_BUFFER_SIZE = 1 << 20
+
+
 def copy_csv_to_postgres(conn, schema: str, table: str, csv_path: Path, columns: List[str]):
     with conn.cursor() as cur:
         cur.execute(f'SET search_path TO "{schema}"')
-        with csv_path.open("r", encoding="utf-8") as f:
-            next(f)
+        # Seed data is reproducible, so losing the tail of a crashed load is fine.
+        cur.execute("SET LOCAL synchronous_commit = off")
+        # Binary mode: copy_expert forwards the raw UTF-8 bytes as-is, instead
+        # of the text layer decoding every chunk just for psycopg2 to re-encode it.
+        with csv_path.open("rb", buffering=COPY_BUFFER_SIZE) as f:
+            next(f)  # skip header line
             cols_sql = ", ".join([f'"{c}"' for c in columns])
             cur.copy_expert(
                 f'COPY "{table}" ({cols_sql}) FROM STDIN WITH (FORMAT CSV)',
                 f,
+                size=COPY_BUFFER_SIZE,
             )
 
 
@@ -1521,7 +1822,89 @@ def truncate_tables(conn, schema: str, load_order: List[str]):
             cur.execute(f'TRUNCATE TABLE "{t}" RESTART IDENTITY CASCADE;')
 
 
-def cache_pk_values(conn, schema: str, table: str, pk: Optional[PrimaryKey], ref_ids: Dict[str, List[Any]]):
+def apply_session_tuning(conn):
+    """
+    Bulk-load GUCs for the whole session (the per-COPY SET LOCALs still apply
+    on top). Only settings changeable at session scope; the postmaster-level
+    knobs (max_wal_size, checkpoint_timeout) belong in the container config.
+    """
+    if not AGGRESSIVE_TUNING:
+        return
+    with conn.cursor() as cur:
+        cur.execute("SET synchronous_commit = off")
+        cur.execute("SET wal_writer_delay = '10s'")
+        cur.execute("SET commit_delay = 100000")
+        cur.execute("SET temp_buffers = '256MB'")
+        cur.execute("SET work_mem = '256MB'")
+        cur.execute("SET maintenance_work_mem = '512MB'")
+    conn.commit()
+
+
+def set_tables_unlogged(conn, schema: str, load_order: List[str]):
+    with conn.cursor() as cur:
+        cur.execute(f'SET search_path TO "{schema}"')
+        # Children first: a logged table may not reference an unlogged parent.
+        for t in reversed(load_order):
+            cur.execute(f'ALTER TABLE "{t}" SET UNLOGGED')
+
+
+def set_tables_logged(conn, schema: str, load_order: List[str]):
+    with conn.cursor() as cur:
+        cur.execute(f'SET search_path TO "{schema}"')
+        for t in load_order:
+            cur.execute(f'ALTER TABLE "{t}" SET LOGGED')
+
+
+def drop_secondary_indexes(conn, schema: str) -> List[str]:
+    """
+    Drop indexes that do not back a constraint (PK/UNIQUE indexes stay, since
+    DROP INDEX cannot remove those anyway) and return their CREATE INDEX
+    statements so they can be rebuilt after the load.
+    """
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT i.indexrelid::regclass::text, pg_get_indexdef(i.indexrelid)
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indrelid
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = %s
+              AND NOT i.indisprimary
+              AND NOT EXISTS (
+                SELECT 1 FROM pg_constraint con WHERE con.conindexid = i.indexrelid
+              )
+            """,
+            (schema,),
+        )
+        found = cur.fetchall()
+        for idx_name, _ in found:
+            cur.execute(f"DROP INDEX {idx_name}")
+    return [indexdef for _, indexdef in found]
+
+
+def rebuild_indexes(index_defs: List[str]):
+    """Re-run the captured CREATE INDEX statements, one connection per worker."""
+    if not index_defs:
+        return
+
+    def _create(indexdef: str):
+        c = psycopg2.connect(pg_dsn(PG))
+        try:
+            c.autocommit = True
+            if AGGRESSIVE_TUNING:
+                with c.cursor() as cur:
+                    cur.execute("SET maintenance_work_mem = '512MB'")
+            with c.cursor() as cur:
+                cur.execute(indexdef)
+        finally:
+            c.close()
+
+    with ThreadPoolExecutor(max_workers=min(4, len(index_defs))) as pool:
+        for _ in pool.map(_create, index_defs):
+            pass
+
+
+def cache_pk_values(conn, schema: str, table: str, pk: Optional[PrimaryKey], ref_ids: Dict[str, np.ndarray]):
     """
     ✅ After loading a table, cache its single-column PK values into ref_ids[table_lc].
     This fixes cases like check_in.stay_id where stay ids must exist in ref_ids["stay"].
@@ -1535,7 +1918,101 @@ def cache_pk_values(conn, schema: str, table: str, pk: Optional[PrimaryKey], ref
     with conn.cursor() as cur:
         cur.execute(f'SET search_path TO "{schema}"')
         cur.execute(f'SELECT "{pk_col}" FROM "{table}" ORDER BY "{pk_col}"')
-        ref_ids[table_lc] = [r[0] for r in cur.fetchall()]
+        # ndarray (int64 for serial PKs) so FK draws can be vectorized downstream.
+        ref_ids[table_lc] = np.asarray([r[0] for r in cur.fetchall()])
+
+
+# -------------------------
+# Per-table load pipeline (serial + pooled)
+# -------------------------
+def load_one_table(conn, fake, schema, table, cols, pk, fk_map, ref_ids, n_rows, enums, unique_cols):
+    print(f"→ {table}: generating {n_rows:,}", flush=True)
+    precompute_row_locations(fake, table, n_rows)
+    csv_path = generate_table_csv(
+        fake=fake,
+        out_dir=OUT_DIR,
+        table=table,
+        cols=cols,
+        pk=pk,
+        fk_map=fk_map,
+        ref_ids=ref_ids,
+        n_rows=n_rows,
+        enums=enums,
+        unique_cols=unique_cols,
+    )
+    release_row_locations(table)
+
+    print(f"→ {table}: loading via COPY", flush=True)
+    copy_csv_to_postgres(conn, schema, table, csv_path, [c.column for c in cols])
+    conn.commit()
+    print(f"✅ {table}: generated+loaded {n_rows:,} rows", flush=True)
+
+    # ✅ CRITICAL: cache real PK ids for downstream FK generation
+    cache_pk_values(conn, schema, table, pk, ref_ids)
+
+
+def _copy_and_cache(schema, table, cols, pk, csv_path):
+    """
+    COPY one generated CSV and fetch its DB-truth PK ids, on a dedicated
+    connection so the call can run on a background thread (psycopg2 cursors
+    must not be shared across threads). Used by the serial pipeline in main().
+    """
+    conn = psycopg2.connect(pg_dsn(PG))
+    conn.autocommit = False
+    try:
+        apply_session_tuning(conn)
+        if DROP_INDEXES_DURING_LOAD:
+            with conn.cursor() as cur:
+                cur.execute("SET session_replication_role = replica")
+            conn.commit()
+        print(f"→ {table}: loading via COPY", flush=True)
+        copy_csv_to_postgres(conn, schema, table, csv_path, [c.column for c in cols])
+        conn.commit()
+        print(f"✅ {table}: loaded", flush=True)
+        ids: Dict[str, np.ndarray] = {}
+        cache_pk_values(conn, schema, table, pk, ids)
+        return table.lower(), ids.get(table.lower(), [])
+    finally:
+        conn.close()
+
+
+# Built once per pool worker by _init_seed_worker; Faker() construction is
+# expensive (locale provider setup), so don't pay it per table.
+_WORKER_FAKE: Optional[Faker] = None
+
+
+def _init_seed_worker():
+    global _WORKER_FAKE
+    _WORKER_FAKE = Faker()
+
+
+def _load_table_worker(table, cols, pk, fk_map, ref_ids, n_rows, enums, unique_cols, schema):
+    """
+    Pool worker: one table end-to-end on a dedicated connection. RNG streams
+    are reseeded per (SEED, table) — not per worker id — so results do not
+    depend on which worker picks up which table, and the fresh PK list is
+    returned to the parent instead of sharing state.
+    """
+    global _NP_RNG
+    random.seed(f"{SEED}:{table}")
+    Faker.seed(f"{SEED}:{table}")
+    _NP_RNG = np.random.default_rng([SEED, zlib.crc32(table.encode())])
+    _reset_rand_buffer()
+    fake = _WORKER_FAKE if _WORKER_FAKE is not None else Faker()
+
+    conn = psycopg2.connect(pg_dsn(PG))
+    conn.autocommit = False
+    try:
+        apply_session_tuning(conn)
+        if DROP_INDEXES_DURING_LOAD:
+            with conn.cursor() as cur:
+                cur.execute("SET session_replication_role = replica")
+            conn.commit()
+        local_ids: Dict[str, np.ndarray] = dict(ref_ids)
+        load_one_table(conn, fake, schema, table, cols, pk, fk_map, local_ids, n_rows, enums, unique_cols)
+        return table.lower(), local_ids.get(table.lower(), [])
+    finally:
+        conn.close()
 
 
 # -------------------------
@@ -1547,15 +2024,17 @@ def main():
     Faker.seed(SEED)
 
     conn = psycopg2.connect(pg_dsn(PG))
-    conn.autocommit = True
+    # One long-lived connection, one transaction per table: SET LOCAL tuning
+    # (synchronous_commit) applies for the COPY, and a failed table rolls back
+    # cleanly instead of leaving a partial load behind.
+    conn.autocommit = False
+    apply_session_tuning(conn)
     schema = PG.schema
 
-    tables = fetch_tables(conn, schema)
-    cols_by_table = fetch_columns(conn, schema)
-    pks = fetch_primary_keys(conn, schema)
-    fks = fetch_foreign_keys(conn, schema)
-    enums = fetch_enum_values(conn)
-    unique_cols = fetch_unique_columns(conn, schema)
+    # Four catalog queries total (columns, PK+UNIQUE, FKs, enums), fired on
+    # parallel connections. No DB metadata access after this.
+    cols_by_table, pks, unique_cols, fks, enums = fetch_catalog_metadata(schema)
+    tables = sorted(cols_by_table)
 
     fk_map = build_fk_map(fks)
     load_order = topo_sort_tables(tables, fks)
@@ -1575,39 +2054,109 @@ def main():
     if TRUNCATE_FIRST:
         print("Truncating tables...", flush=True)
         truncate_tables(conn, schema, load_order)
+        conn.commit()
         print("Truncate done.", flush=True)
 
-    # ✅ Always use lowercase keys in ref_ids
-    ref_ids: Dict[str, List[Any]] = {}
+    if STAGING_UNLOGGED:
+        # Tables are empty right after the truncate, so the UNLOGGED rewrite is free.
+        set_tables_unlogged(conn, schema, load_order)
+        conn.commit()
+        print("Tables set UNLOGGED for the load.", flush=True)
+
+    dropped_index_defs: List[str] = []
+    if DROP_INDEXES_DURING_LOAD:
+        dropped_index_defs = drop_secondary_indexes(conn, schema)
+        with conn.cursor() as cur:
+            # Skip FK trigger firing during the COPYs; rows are FK-valid by construction.
+            cur.execute("SET session_replication_role = replica")
+        conn.commit()
+        print(f"Dropped {len(dropped_index_defs)} secondary indexes for the load.", flush=True)
+        # The captured definitions live only in this process; print them so a
+        # crashed run still leaves a record of how to recreate the indexes.
+        for indexdef in dropped_index_defs:
+            print(f"  saved: {indexdef}", flush=True)
 
-    for t in load_order:
-        cols = cols_by_table.get(t, [])
-        if not cols:
-            continue
-        n = int(rc.get(t, 0))
-        if n <= 0:
-            continue
-
-        print(f"→ {t}: generating {n:,}", flush=True)
-        csv_path = generate_table_csv(
-            fake=fake,
-            out_dir=OUT_DIR,
-            table=t,
-            cols=cols,
-            pk=pks.get(t),
-            fk_map=fk_map,
-            ref_ids=ref_ids,
-            n_rows=n,
-            enums=enums,
-            unique_cols=unique_cols,
-        )
+    # ✅ Always use lowercase keys in ref_ids
+    ref_ids: Dict[str, np.ndarray] = {}
 
-        print(f"→ {t}: loading via COPY", flush=True)
-        copy_csv_to_postgres(conn, schema, t, csv_path, [c.column for c in cols])
-        print(f"✅ {t}: generated+loaded {n:,} rows", flush=True)
+    try:
+        for level in fk_levels(tables, fks):
+            todo = [t for t in level if cols_by_table.get(t) and int(rc.get(t, 0)) > 0]
+            if not todo:
+                continue
 
-        # ✅ CRITICAL: cache real PK ids for downstream FK generation
-        cache_pk_values(conn, schema, t, pks.get(t), ref_ids)
+            if PARALLEL_WORKERS > 1 and len(todo) > 1:
+                with ProcessPoolExecutor(
+                    max_workers=min(PARALLEL_WORKERS, len(todo)), initializer=_init_seed_worker
+                ) as pool:
+                    futures = [
+                        pool.submit(
+                            _load_table_worker,
+                            t,
+                            cols_by_table[t],
+                            pks.get(t),
+                            fk_map,
+                            ref_ids,
+                            int(rc[t]),
+                            enums,
+                            unique_cols,
+                            schema,
+                        )
+                        for t in todo
+                    ]
+                    for fut in futures:
+                        table_lc, ids = fut.result()
+                        if len(ids):
+                            ref_ids[table_lc] = ids
+            else:
+                # Pipeline: while table T's COPY runs on a background thread
+                # (dedicated connection), the main thread already generates the
+                # next table's CSV. Tables within a level are FK-independent, so
+                # the DB-truth PK lists are only folded back into ref_ids at the
+                # level boundary, before any dependent table generates.
+                with ThreadPoolExecutor(max_workers=1) as copy_pool:
+                    pending = []
+                    for t in todo:
+                        n = int(rc[t])
+                        print(f"→ {t}: generating {n:,}", flush=True)
+                        precompute_row_locations(fake, t, n)
+                        csv_path = generate_table_csv(
+                            fake=fake,
+                            out_dir=OUT_DIR,
+                            table=t,
+                            cols=cols_by_table[t],
+                            pk=pks.get(t),
+                            fk_map=fk_map,
+                            ref_ids=ref_ids,
+                            n_rows=n,
+                            enums=enums,
+                            unique_cols=unique_cols,
+                        )
+                        release_row_locations(t)
+                        pending.append(copy_pool.submit(_copy_and_cache, schema, t, cols_by_table[t], pks.get(t), csv_path))
+                    for fut in pending:
+                        table_lc, ids = fut.result()
+                        if len(ids):
+                            ref_ids[table_lc] = ids
+
+    finally:
+        # Rebuild even when the load blows up partway: the dropped definitions
+        # exist only in this process, so exiting without recreating them would
+        # leave the schema permanently stripped of its secondary indexes.
+        # rebuild_indexes opens fresh connections, so it works even if `conn`
+        # died — which is also why it runs before the role reset on `conn`.
+        if DROP_INDEXES_DURING_LOAD:
+            print(f"Rebuilding {len(dropped_index_defs)} secondary indexes...", flush=True)
+            rebuild_indexes(dropped_index_defs)
+            with conn.cursor() as cur:
+                cur.execute("SET session_replication_role = origin")
+            conn.commit()
+
+    if STAGING_UNLOGGED:
+        # One sequential WAL pass per table instead of per-row WAL during the load.
+        print("Re-logging tables...", flush=True)
+        set_tables_logged(conn, schema, load_order)
+        conn.commit()
 
     conn.close()
     print("✅ DONE", flush=True)
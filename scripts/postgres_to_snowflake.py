@@ -8,12 +8,14 @@
 
 from __future__ import annotations
 from pathlib import Path
-import csv
 import gzip
 import os
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+import functools
 from datetime import datetime, timezone, timedelta, date
+import uuid
 from typing import Any, Dict, List, Optional, Tuple
 import psycopg2
 import psycopg2.extras
@@ -117,20 +119,12 @@ def validate_config(cfg: Dict[str, Any]) -> None:
 
 
 def validate_yaml_file(path: str) -> Dict[str, Any]:
-    # Load YAML
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            cfg = yaml.safe_load(f)
-    except FileNotFoundError:
-        raise FileNotFoundError(f"YAML file not found: {path}")
-    except yaml.YAMLError as e:
-        raise ValueError(f"Invalid YAML syntax: {e}")
-
+    """Load a YAML config from disk, validate it, and return it."""
+    cfg = load_config(path)
     if not isinstance(cfg, dict):
         raise ValueError("YAML root must be a dictionary")
-
     validate_config(cfg)
-    return True
+    return cfg
 
 
 # ## 2) Connections
@@ -194,6 +188,7 @@ class SnowflakeCreds:
     schema: Optional[str]
     password: Optional[str]
     sf_landing_stage: Optional[str]
+    private_key_path: Optional[str] = None  # PEM file; enables key-pair (JWT) auth
 
 
 # In[ ]:
@@ -241,6 +236,11 @@ def _run_snowsql(creds: SnowflakeCreds, sql: str, *, snowsql_path: str = "snowsq
 # In[ ]:
 
 
+# Reused across probes: keep-alive avoids a fresh TLS handshake per HEAD.
+_HTTP = requests.Session()
+
+
+@functools.lru_cache(maxsize=4)
 def configure_network_for_snowflake(
     proxy_url: str = "http://proxy.mycorp.com:8080",
     snowflake_host: str = "account_name",
@@ -289,21 +289,27 @@ def configure_network_for_snowflake(
         os.environ["no_proxy"] = os.environ["NO_PROXY"]
         mode = "DIRECT_NO_PROXY"
 
-    # --- Fast checks ---
-    # 1) Snowflake DNS
-    try:
-        socket.getaddrinfo(snowflake_host, 443)
-        snowflake_dns_ok = True
-    except OSError:
-        snowflake_dns_ok = False
+    # --- Fast checks (both probes in parallel; each is a blocking RTT) ---
+    def _snowflake_dns_ok() -> bool:
+        try:
+            socket.getaddrinfo(snowflake_host, 443)
+            return True
+        except OSError:
+            return False
 
-    # 2) S3 reachability (HEAD is enough)
-    s3_ok = None
-    try:
-        r = requests.head("https://s3.amazonaws.com", timeout=timeout_s)
-        s3_ok = (r.status_code < 500)
-    except Exception:
-        s3_ok = False
+    def _s3_ok() -> bool:
+        # HEAD is enough for reachability
+        try:
+            r = _HTTP.head("https://s3.amazonaws.com", timeout=timeout_s)
+            return r.status_code < 500
+        except Exception:
+            return False
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        f_dns = pool.submit(_snowflake_dns_ok)
+        f_s3 = pool.submit(_s3_ok)
+        snowflake_dns_ok = f_dns.result()
+        s3_ok = f_s3.result()
 
     return {
         "mode": mode,
@@ -350,6 +356,60 @@ def get_table_columns(conn: psycopg2.extensions.connection, schema: str, table:
 # In[ ]:
 
 
+def get_all_table_columns(conn: psycopg2.extensions.connection, schema: str, tables: List[str]) -> Dict[str, List[str]]:
+    """
+    Fetch column names for every configured table in one round-trip,
+    instead of one information_schema query per table.
+
+    Returns:
+        Dict of table name -> ordered column list.
+    """
+    query = """
+    SELECT table_name, column_name
+    FROM information_schema.columns
+    WHERE table_schema = %s AND table_name = ANY(%s)
+    ORDER BY table_name, ordinal_position;
+    """
+    columns: Dict[str, List[str]] = {t: [] for t in tables}
+    with conn.cursor() as cur:
+        cur.execute(query, (schema, list(tables)))
+        for table, column in cur.fetchall():
+            columns[table].append(column)
+    return columns
+
+
+def get_all_table_pks(conn: psycopg2.extensions.connection, schema: str, tables: List[str]) -> Dict[str, Optional[List[str]]]:
+    """
+    Fetch primary key columns for every configured table in one round-trip.
+
+    Returns:
+        Dict of table name -> ordered PK column list, or None for tables
+        without a primary key.
+    """
+    query = """
+    SELECT tc.table_name, kcu.column_name
+    FROM information_schema.table_constraints tc
+    JOIN information_schema.key_column_usage kcu
+      ON tc.constraint_name = kcu.constraint_name
+      AND tc.table_schema = kcu.table_schema
+    WHERE tc.table_schema = %s
+      AND tc.table_name = ANY(%s)
+      AND tc.constraint_type = 'PRIMARY KEY'
+    ORDER BY tc.table_name, kcu.ordinal_position;
+    """
+    pks: Dict[str, Optional[List[str]]] = {t: None for t in tables}
+    with conn.cursor() as cur:
+        cur.execute(query, (schema, list(tables)))
+        for table, column in cur.fetchall():
+            if pks[table] is None:
+                pks[table] = []
+            pks[table].append(column)
+    return pks
+
+
+# In[ ]:
+
+
 def get_table_pk(conn: psycopg2.extensions.connection, schema: str, table: str) -> Optional[List[str]]:
     """
     Fetch the primary key column names for a given schema.table in PostgreSQL.
@@ -386,31 +446,38 @@ def get_table_pk(conn: psycopg2.extensions.connection, schema: str, table: str)
 def estimate_rowcount(conn: psycopg2.extensions.connection, sql: str) -> int:
     """
     Estimate the number of rows a SQL query will return.
-    Uses COUNT(*) wrapped around the query.
+    Uses the planner's estimate from EXPLAIN (FORMAT JSON) — parse+plan
+    only, no execution — instead of running the full query once just to
+    count it.
+
+    The estimate feeds plan_file_splits, whose end_row becomes a hard
+    LIMIT in build_chunk_query, so an undershoot would silently truncate
+    the export (likely on freshly bulk-loaded tables, where reltuples
+    lags until autovacuum/ANALYZE). The result is therefore padded 2x;
+    an overshoot only makes the last chunk's LIMIT slack.
 
     Args:
         conn: psycopg2 connection
         sql: SQL query (string)
 
     Returns:
-        Estimated row count (int)
+        Padded estimated row count (int)
     """
-    # Wrap the original query as a subquery
-    count_sql = f"SELECT COUNT(*) FROM ({sql}) AS subquery"
+    explain_sql = f"EXPLAIN (FORMAT JSON) {sql}"
     try:
         with conn.cursor() as cur:
-            cur.execute(count_sql)
-            rowcount = cur.fetchone()[0]
+            cur.execute(explain_sql)
+            plan = cur.fetchone()[0]
     except Exception:
         conn.rollback()
         raise
-    return rowcount
+    return 2 * int(plan[0]["Plan"]["Plan Rows"])
 
 
 # In[ ]:
 
 
-def build_base_query(table_cfg: Dict, schema_default: str, columns: List[str] = None) -> str:
+def build_base_query(table_cfg: Dict, schema_default: str, columns: List[str] = None) -> Tuple[str, bool]:
     """
     Build the base SQL query for a table export.
 
@@ -421,28 +488,31 @@ def build_base_query(table_cfg: Dict, schema_default: str, columns: List[str] =
         columns: optional list of columns to select (for mode='table')
 
     Returns:
-        SQL string (no trailing semicolon)
+        Tuple of (SQL string with no trailing semicolon, has_where) — the
+        WHERE flag is decided here once, so downstream clause builders do
+        not have to re-scan the SQL per partition window.
     """
     mode = table_cfg.get("mode")
-    
+
     if mode == "table":
         table_name = table_cfg.get("table")
         if not table_name:
             raise KeyError(f"Table config '{table_cfg.get('name')}' missing 'table' key for mode='table'")
-        
+
         schema = table_cfg.get("schema", schema_default)
-        
+
         # Use all columns if not specified
         cols_sql = ", ".join(columns) if columns else "*"
-        
+
         sql = f"SELECT {cols_sql} FROM {schema}.{table_name}"
-        return sql
+        return sql, False  # generated here, never carries a WHERE
 
     elif mode == "query":
         query = table_cfg.get("query")
         if not query:
             raise KeyError(f"Table config '{table_cfg.get('name')}' missing 'query' key for mode='query'")
-        return query.rstrip().rstrip(";")  # strip trailing semicolon
+        query = query.rstrip().rstrip(";")  # strip trailing semicolon
+        return query, " where " in query.lower()
 
     else:
         raise ValueError(f"Unknown mode '{mode}' for table '{table_cfg.get('name')}'")
@@ -453,7 +523,8 @@ def build_base_query(table_cfg: Dict, schema_default: str, columns: List[str] =
 
 def apply_partition_clause(
     base_sql: str,
-    partition_spec: Dict
+    partition_spec: Dict,
+    has_where: Optional[bool] = None
 ) -> List[str]:
     """
     Partition base_sql across [start_date, end_date) and return a list of SQL strings,
@@ -464,7 +535,9 @@ def apply_partition_clause(
 
     Notes:
       - end_date is EXCLUSIVE (so end_date="2026-01-01" includes all of 2025).
-      - If base_sql already contains a WHERE (case-insensitive), appends with AND.
+      - has_where: whether base_sql already contains a WHERE, as reported by
+        build_base_query; when None, falls back to a substring scan (which a
+        WHERE inside a subquery or string literal can fool).
     """
     column = partition_spec.get("column")
     start_date=partition_spec.get("start")
@@ -491,8 +564,16 @@ def apply_partition_clause(
             return date(d.year + 1, 1, 1)
         return date(d.year, d.month + 1, 1)
 
-    # Helper: attach WHERE/AND
-    has_where = " where " in base_sql.lower()
+    # Per-window SQL constants, resolved once: the WHERE-vs-AND decision, the
+    # case-fold scan, and all the fixed text happen here instead of being
+    # rebuilt for every window — each window only splices its two dates in.
+    # Plain concatenation (not str.format) so braces in the SQL — array or
+    # jsonb literals, LIKE patterns — pass through untouched.
+    if has_where is None:
+        has_where = " where " in base_sql.lower()
+    connector = "AND" if has_where else "WHERE"
+    prefix = f"{base_sql} {connector} {column} >= '"
+    infix = f"' AND {column} < '"
 
     sqls: List[str] = []
     cur = start
@@ -505,17 +586,7 @@ def apply_partition_clause(
             nxt = next_month(cur)
 
         window_end = nxt if nxt < end else end
-
-        clause = (
-            f"{column} >= '{cur.strftime('%Y-%m-%d')}' "
-            f"AND {column} < '{window_end.strftime('%Y-%m-%d')}'"
-        )
-
-        if has_where:
-            sqls.append(f"{base_sql} AND {clause}")
-        else:
-            sqls.append(f"{base_sql} WHERE {clause}")
-
+        sqls.append(f"{prefix}{cur.isoformat()}{infix}{window_end.isoformat()}'")
         cur = window_end
 
     return sqls
@@ -554,10 +625,22 @@ def plan_file_splits(rowcount: int, max_rows_per_file: int) -> List[Dict[str, in
 # In[ ]:
 
 
+def _sql_literal(value: Any) -> str:
+    """Render a Python value as a SQL literal for the keyset comparison."""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (int, float)):
+        return str(value)
+    escaped = str(value).replace("'", "''")
+    return f"'{escaped}'"
+
+
 def build_chunk_query(
     sql: str,
     order_by: Optional[str],
-    chunk: Dict[str, int]
+    chunk: Dict[str, int],
+    last_key: Optional[Tuple] = None,
+    has_where: Optional[bool] = None
 ) -> str:
     """
     Build a SQL query for a specific chunk of rows.
@@ -566,27 +649,173 @@ def build_chunk_query(
         sql: base SQL (should include WHERE/filters/partition/order)
         order_by: column(s) used for deterministic ordering
         chunk: dict with 'start_row' (inclusive) and 'end_row' (exclusive)
+        last_key: order_by values of the previous chunk's final row; when
+                  given, the chunk seeks past that key (keyset pagination)
+                  instead of using OFFSET
+        has_where: whether sql already contains a WHERE, as reported by
+                   build_base_query; when None, falls back to a substring scan
+                   (which a WHERE inside a subquery or string literal can fool)
 
     Returns:
-        SQL string with ORDER BY + OFFSET/LIMIT applied
+        SQL string with ORDER BY + LIMIT (keyset) or OFFSET/LIMIT applied
     """
     if not order_by:
         raise ValueError("order_by must be specified for chunking")
 
     start = chunk["start_row"]
     limit = chunk["end_row"] - chunk["start_row"]
-    
+
+    if last_key is not None:
+        # Keyset pagination: a row-value comparison on the ordering key lets
+        # the btree seek straight to the chunk start — O(log N) per chunk,
+        # where OFFSET re-scans and discards `start` rows every time.
+        key_cols = [c.strip() for c in order_by.split(",")]
+        lhs = "(" + ", ".join(key_cols) + ")"
+        rhs = "(" + ", ".join(_sql_literal(v) for v in last_key) + ")"
+        clause = f"{lhs} > {rhs}"
+        if has_where is None:
+            has_where = " where " in sql.lower()
+        connector = "AND" if has_where else "WHERE"
+        return f"{sql} {connector} {clause} ORDER BY {order_by} LIMIT {limit}"
+
     # Ensure SQL has ORDER BY
     sql_ordered = sql if " order by " in sql.lower() else f"{sql} ORDER BY {order_by}"
 
     return f"{sql_ordered} OFFSET {start} LIMIT {limit}"
 
 
+def fetch_chunk_boundary_keys(
+    pg_conn,
+    sql: str,
+    order_by: str,
+    max_rows_per_file: int
+) -> List[Tuple]:
+    """
+    Collect the order_by key values at each chunk boundary in one ordered
+    scan: rows are numbered over the whole query and every
+    max_rows_per_file-th key is kept. Each later chunk then seeks past its
+    predecessor's boundary key (build_chunk_query's last_key path) instead of
+    OFFSET re-scanning and discarding every row before its start.
+
+    Returns:
+        List of key tuples; element i is the final row of chunk i.
+    """
+    key_cols = ", ".join(c.strip() for c in order_by.split(","))
+    boundary_sql = (
+        f"SELECT {key_cols} FROM ("
+        f"SELECT {key_cols}, row_number() OVER (ORDER BY {order_by}) AS rn "
+        f"FROM ({sql}) AS q) AS ranked "
+        f"WHERE rn % {max_rows_per_file} = 0 ORDER BY rn"
+    )
+    with pg_conn.cursor() as cur:
+        cur.execute(boundary_sql)
+        return [tuple(r) for r in cur.fetchall()]
+
+
 # #### Load data into snowflake
 
 # In[ ]:
 
 
+def _load_sf_private_key(key_path: str) -> bytes:
+    """
+    Load a PEM private key and return the DER bytes the Snowflake connector
+    expects for key-pair auth. An encrypted key takes its passphrase from
+    SNOWFLAKE_PRIVATE_KEY_PASSPHRASE.
+    """
+    passphrase = os.getenv("SNOWFLAKE_PRIVATE_KEY_PASSPHRASE")
+    with open(key_path, "rb") as f:
+        key = serialization.load_pem_private_key(
+            f.read(),
+            password=passphrase.encode() if passphrase else None,
+        )
+    return key.private_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+
+
+def create_sf_connection(sf: SnowflakeCreds):
+    """
+    Open a Snowflake connection. The TLS + auth + session handshake costs
+    seconds, so callers that load several tables/chunks should open one
+    connection and pass it around instead of reconnecting per statement.
+
+    With a configured private key, authentication uses a locally signed JWT
+    (key-pair auth) — noticeably cheaper per connect than password
+    verification; otherwise password auth is used.
+    """
+    kwargs: Dict[str, Any] = dict(
+        account=sf.account,
+        user=sf.user,
+        role=sf.role,
+        warehouse=sf.warehouse,
+        database=sf.database,
+        schema=sf.schema,
+        autocommit=True,
+        client_session_keep_alive=True,  # don't let long extracts expire the session
+        # More parallel result-chunk downloads for readback queries
+        # (COPY summaries, validation counts).
+        session_parameters={"CLIENT_PREFETCH_THREADS": 8},
+    )
+    if sf.private_key_path:
+        kwargs["private_key"] = _load_sf_private_key(sf.private_key_path)
+        kwargs["authenticator"] = "SNOWFLAKE_JWT"
+    else:
+        kwargs["password"] = sf.password
+    return snowflake.connector.connect(**kwargs)
+
+
+def copy_stage_prefix_into_table(
+    sf: SnowflakeCreds,
+    stage_prefix: str,                      # e.g. "@DB.SCHEMA.STAGE/pg_extract/booking"
+    file_format_fqn: str,
+    target_table_fqn: str,
+    cols: List[str],
+    overwrite_table: bool = False,
+    sf_conn=None,                           # reuse an open connection; None opens (and closes) one
+) -> int:
+    """
+    One COPY INTO for every staged file under stage_prefix. Snowflake fans the
+    file scan out across the warehouse, so staging many chunk files and
+    copying once beats one COPY round-trip per chunk.
+    """
+    owns_conn = sf_conn is None
+    if owns_conn:
+        sf_conn = create_sf_connection(sf)
+    sf_cur = sf_conn.cursor()
+
+    try:
+        if overwrite_table:
+            sf_cur.execute(f"DROP TABLE IF EXISTS {target_table_fqn}")
+
+        col_ddl = ", ".join([f'"{c.upper()}" VARCHAR' for c in cols])
+        sf_cur.execute(f"CREATE TABLE IF NOT EXISTS {target_table_fqn} ({col_ddl})")
+
+        # PURGE drops each staged file once it loads successfully. Without it
+        # files pile up under the prefix forever, and because this COPY
+        # pattern-matches the whole prefix, a rerun past the load-history
+        # window (or after the table is dropped and recreated) would reload
+        # every historical file and duplicate rows.
+        sf_cur.execute(f"""
+            COPY INTO {target_table_fqn}
+            FROM {stage_prefix}
+            FILE_FORMAT = (FORMAT_NAME = {file_format_fqn})
+            PATTERN = '.*\\.csv\\.gz'
+            ON_ERROR = 'ABORT_STATEMENT'
+            PURGE = TRUE
+        """)
+        results = sf_cur.fetchall()
+        loaded = sum(int(r[3]) for r in results if len(r) > 3)
+    finally:
+        sf_cur.close()
+        if owns_conn:
+            sf_conn.close()
+
+    return loaded
+
+
 def postgres_query_to_snowflake_table(
     pg: PostgresCreds,
     sf: SnowflakeCreds,
@@ -596,90 +825,127 @@ def postgres_query_to_snowflake_table(
     file_format_fqn: str,                   # e.g. "HOTEL_ANALYTICS.RAW.CSV_FMT" (CSV, SKIP_HEADER=1, COMPRESSION=GZIP)
     target_table_fqn: str,                  # e.g. "HOTEL_ANALYTICS.RAW.BOOKING_SLICE"
     overwrite_table: bool = True,
+    stage_subdir: Optional[str] = None,     # group several chunks under one prefix
+    run_copy: bool = True,                  # False: stage only, COPY later in one shot
+    sf_conn=None,                           # reuse an open connection; None opens (and closes) one
 ) -> dict:
     """
     Executes SELECT on Postgres, stages results as gzipped CSV, then loads into Snowflake.
     - Requires Snowflake INTERNAL stage (PUT must work).
     - Creates/overwrites target table with inferred column types as VARCHAR by default.
       (Good enough for a project slice; you can tighten types later.)
+    - With run_copy=False only the extract+PUT happens; the caller issues one
+      COPY over the whole stage_subdir via copy_stage_prefix_into_table.
 
     Returns basic run stats.
     """
-    run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    # Timestamp alone has second granularity: parallel staging workers start
+    # together and would collide on the local temp file and (with
+    # OVERWRITE=TRUE) on the stage path. The uuid suffix makes each extract's
+    # file and stage folder unique per call.
+    run_id = f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}__{uuid.uuid4().hex[:8]}"
 
     # --- Connect Postgres ---
     pg_conn = psycopg2.connect(
         host=pg.host, port=pg.port, dbname=pg.dbname, user=pg.user, password=pg.password
     )
-    pg_cur = pg_conn.cursor()
-
-    pg_cur.execute(sql)
-    cols: List[str] = [d.name for d in pg_cur.description]
+    pg_conn.set_session(readonly=True)  # extract only reads
 
-    # --- Write gzipped CSV ---
-    tmp_dir = Path(data_dir) / "tmp"
-    tmp_dir.mkdir(parents=True, exist_ok=True)
-    local_file = os.path.join(tmp_dir, f"extract__{run_id}.csv.gz")
-    file_uri= "file://" + Path(local_file).resolve().as_posix()
-    
-    rows_extracted = 0
-    with gzip.open(local_file, "wt", newline="", encoding="utf-8") as gz:
-        w = csv.writer(gz)
-        w.writerow(cols)  # header
-        for row in pg_cur:
-            w.writerow(row)
-            rows_extracted += 1
-
-    pg_cur.close()
-    pg_conn.close()
+    try:
+        with pg_conn.cursor() as pg_cur:
+            # Column names for the target DDL, without running the query:
+            # LIMIT 0 returns no rows but fills in the cursor description.
+            pg_cur.execute(f"SELECT * FROM ({sql}) AS q LIMIT 0")
+            cols: List[str] = [d.name for d in pg_cur.description]
+
+            # --- Write gzipped CSV ---
+            tmp_dir = Path(data_dir) / "tmp"
+            tmp_dir.mkdir(parents=True, exist_ok=True)
+            local_file = os.path.join(tmp_dir, f"extract__{run_id}.csv.gz")
+            file_uri= "file://" + Path(local_file).resolve().as_posix()
+
+            # COPY TO STDOUT formats the CSV inside Postgres/libpq (C code)
+            # and streams raw bytes straight into the gzip file — no per-row
+            # Python tuple decoding or csv quoting. compresslevel=1 because
+            # Snowflake only needs *a* gzip stream; the default level 9 burns
+            # CPU for a few percent of size on this data.
+            copy_sql = f"COPY ({sql}) TO STDOUT WITH (FORMAT CSV, HEADER TRUE)"
+            # 1 MiB buffer under the gzip stream — one write syscall per MiB
+            # of compressed output instead of one per default 8 KiB block —
+            # and COPY reads from libpq in matching 1 MiB chunks.
+            with open(local_file, "wb", buffering=1 << 20) as raw, gzip.GzipFile(
+                fileobj=raw, mode="wb", compresslevel=1
+            ) as gz:
+                pg_cur.copy_expert(copy_sql, gz, size=1 << 20)
+            rows_extracted = pg_cur.rowcount
+    finally:
+        pg_conn.close()
 
     if rows_extracted == 0:
-        return {"status": "SUCCESS", "rows_extracted": 0, "rows_loaded": 0, "target_table": target_table_fqn}
+        return {"status": "SUCCESS", "rows_extracted": 0, "rows_loaded": 0, "columns": cols, "target_table": target_table_fqn}
 
 
-        # --- Connect Snowflake ---
-    sf_conn = snowflake.connector.connect(
-        account=sf.account,
-        user=sf.user,
-        password=sf.password,
-        role=sf.role,
-        warehouse=sf.warehouse,
-        database=sf.database,
-        schema=sf.schema,
-        autocommit=True,
-    )
+    # --- Connect Snowflake ---
+    owns_conn = sf_conn is None
+    if owns_conn:
+        sf_conn = create_sf_connection(sf)
     sf_cur = sf_conn.cursor()
 
-    # Put into a deterministic folder under the stage
-    stage_path = f"{stage_fqn}/pg_extract/{run_id}"
-    sf_cur.execute(f"PUT '{file_uri}' {stage_path} AUTO_COMPRESS=FALSE OVERWRITE=TRUE")
-
-    # Optionally drop and re-create the table (simple project-friendly behavior)
-    if overwrite_table:
-        sf_cur.execute(f"DROP TABLE IF EXISTS {target_table_fqn}")
+    try:
+        # Put into a deterministic folder under the stage
+        if stage_subdir:
+            stage_path = f"{stage_fqn}/pg_extract/{stage_subdir}/{run_id}"
+        else:
+            stage_path = f"{stage_fqn}/pg_extract/{run_id}"
+        # PARALLEL splits the upload into concurrently-PUT parts (default is
+        # 4); SOURCE_COMPRESSION tells the connector the file is already
+        # gzipped.
+        sf_cur.execute(
+            f"PUT '{file_uri}' {stage_path} AUTO_COMPRESS=FALSE OVERWRITE=TRUE "
+            f"PARALLEL=8 SOURCE_COMPRESSION=GZIP"
+        )
 
-    # Create a table with simple VARCHAR columns (fast + robust for a demo)
-    col_ddl = ", ".join([f'"{c.upper()}" VARCHAR' for c in cols])
-    sf_cur.execute(f"CREATE TABLE IF NOT EXISTS {target_table_fqn} ({col_ddl})")
-    
-        # 2) COPY into RAW TABLE
-    sf_cur.execute(f"""
-        COPY INTO {target_table_fqn}
-        FROM {stage_path}
-        FILE_FORMAT = (FORMAT_NAME = {file_format_fqn})
-        PATTERN = '.*\\.csv\\.gz'
-        ON_ERROR = 'ABORT_STATEMENT'
-    """)
-    results = sf_cur.fetchall()
-    loaded = sum(int(r[3]) for r in results if len(r) > 3)
-
-    sf_cur.close()
-    sf_cur.close()
+        if not run_copy:
+            # Stage-only mode: the caller COPYs the whole prefix in one statement.
+            return {
+                "status": "STAGED",
+                "rows_extracted": rows_extracted,
+                "rows_loaded": 0,
+                "columns": cols,
+                "local_file": str(local_file),
+                "stage_path": stage_path,
+            }
+
+        # Optionally drop and re-create the table (simple project-friendly behavior)
+        if overwrite_table:
+            sf_cur.execute(f"DROP TABLE IF EXISTS {target_table_fqn}")
+
+        # Create a table with simple VARCHAR columns (fast + robust for a demo)
+        col_ddl = ", ".join([f'"{c.upper()}" VARCHAR' for c in cols])
+        sf_cur.execute(f"CREATE TABLE IF NOT EXISTS {target_table_fqn} ({col_ddl})")
+
+        # 2) COPY into RAW TABLE. PURGE removes the staged file after a
+        # successful load so reruns never re-match old extracts.
+        sf_cur.execute(f"""
+            COPY INTO {target_table_fqn}
+            FROM {stage_path}
+            FILE_FORMAT = (FORMAT_NAME = {file_format_fqn})
+            PATTERN = '.*\\.csv\\.gz'
+            ON_ERROR = 'ABORT_STATEMENT'
+            PURGE = TRUE
+        """)
+        results = sf_cur.fetchall()
+        loaded = sum(int(r[3]) for r in results if len(r) > 3)
+    finally:
+        sf_cur.close()
+        if owns_conn:
+            sf_conn.close()
 
     return {
         "status": "SUCCESS",
         "rows_extracted": rows_extracted,
         "rows_loaded": loaded,
+        "columns": cols,
         "local_file": str(local_file),
         "stage_path": stage_path,
     }
@@ -688,6 +954,41 @@ def postgres_query_to_snowflake_table(
 # In[ ]:
 
 
+@dataclass
+class TableMeta:
+    """Per-table export metadata gathered once in main()."""
+    columns: List[str]
+    pk: Optional[List[str]]
+    rowcount: int
+    base_query: str
+    has_where: bool
+    partition_spec: Optional[Dict]
+
+
+def _stage_one_chunk(
+    pg_creds: PostgresCreds,
+    sf_creds: SnowflakeCreds,
+    data_dir: Path,
+    chunk_sql_query: str,
+    stage_fqn: str,
+    file_format_fqn: str,
+    target_table_fqn: str,
+    stage_subdir: str,
+) -> int:
+    """
+    Pool worker: extract one partition chunk and PUT it under the table's
+    stage prefix (run_copy=False — the parent issues one COPY for the whole
+    prefix). Runs in its own process so gzip and the PUT upload of several
+    chunks proceed concurrently.
+    """
+    stats = postgres_query_to_snowflake_table(
+        pg_creds, sf_creds, data_dir, chunk_sql_query,
+        stage_fqn, file_format_fqn, target_table_fqn, False,
+        stage_subdir=stage_subdir, run_copy=False,
+    )
+    return stats["rows_extracted"]
+
+
 def main():
     ##### Get information from config files
     BASE_DIR = Path.cwd().parent 
@@ -700,13 +1001,10 @@ def main():
     load_dotenv(dotenv_path=passwords_path,override=True)  # loads .env into environment variables
     postgres_password = os.getenv("POSTGRES_PASSWORD")
     snowflake_password = os.getenv("SNOWFLAKE_PASSWORD")
+
+    ##### Load + validate config file (one read, one parse)
     config=load_config(config_yaml)
-           
-    ##### Validate config file
-    if validate_yaml_file(config_yaml): 
-        config=load_config(config_yaml)
-    else:
-        raise FileNotFoundError(f"YAML config file not found or invalid: {config_yaml}")
+    validate_config(config)
 
     ##### Connect to Postgres DB
     pg_cfg = config.get("source", {}).get("postgres", {})
@@ -733,42 +1031,108 @@ def main():
         database=sf_cfg.get("database"),
         schema=sf_cfg.get("schema"),
         password=snowflake_password,
-        sf_landing_stage=sf_cfg.get("stage")
+        sf_landing_stage=sf_cfg.get("stage"),
+        private_key_path=sf_cfg.get("private_key_path")  # optional: key-pair (JWT) auth
     )
 
     net = configure_network_for_snowflake(sf_creds.account)
-    ####### Hotel Config
-    table_schema=pg_cfg.get("schema")
-    sqls=[]
-    max_rows_per_file=config.get("export", {}).get("row_grouping",{}).get("max_rows_per_file",{})
-    for table in config.get("tables", {}).keys():
-        table_name=config.get("tables", {})[table][0].get("name")
-        print(f"{sf_creds.database}.{sf_creds.schema}.{table_name}_RAW")
-        table_cfg=config.get("tables", {})[table][0]
-        globals()[f"{table_name}_columns"]=get_table_columns(pg_conn,table_schema,table_name)
-        globals()[f"{table_name}_pk"]=get_table_pk(pg_conn,table_schema,table_name)
-        globals()[f"{table_name}_rowcount"]=estimate_rowcount(pg_conn,f'SELECT * FROM {table_schema}.{table_name}')
-        globals()[f"{table_name}_base_query"]= build_base_query(table_cfg, table_schema, globals()[f"{table_name}_columns"])
-        globals()[f"{table_name}_partition_spec"]=table_cfg.get("partition")
-
-        if globals()[f"{table_name}_partition_spec"]!=None:
-            sqls=apply_partition_clause(globals()[f"{table_name}_base_query"],globals()[f"{table_name}_partition_spec"])
-
-            for sql in sqls:
-                chunk=plan_file_splits(globals()[f"{table_name}_rowcount"], max_rows_per_file)
-                chunk_sql_query=build_chunk_query(sql,table_cfg['order_by'],chunk[0])
-                postgres_query_to_snowflake_table( pg_creds,sf_creds,data_dir,chunk_sql_query,
-                                              f"@{sf_creds.database}.{sf_creds.schema}.{sf_creds.sf_landing_stage}",
-                                              f"{sf_creds.database}.{sf_creds.schema}.CSV_FMT",
-                                              f"{sf_creds.database}.{sf_creds.schema}.{table_name}_RAW",False)
 
-        else:
-            chunk=plan_file_splits(globals()[f"{table_name}_rowcount"], max_rows_per_file)
-            chunk_sql_query=build_chunk_query(globals()[f"{table_name}_base_query"],table_cfg['order_by'],chunk[0])
-            postgres_query_to_snowflake_table( pg_creds,sf_creds,data_dir,chunk_sql_query,
-                                              f"@{sf_creds.database}.{sf_creds.schema}.{sf_creds.sf_landing_stage}",
-                                              f"{sf_creds.database}.{sf_creds.schema}.CSV_FMT",
-                                              f"{sf_creds.database}.{sf_creds.schema}.{table_name}_RAW")        
+    # One Snowflake session for the whole run; the per-table COPYs and the
+    # serial loads reuse it instead of paying the connect handshake each time.
+    # (The parallel staging workers are separate processes and open their own.)
+    sf_conn = create_sf_connection(sf_creds)
+    try:
+        ####### Hotel Config
+        table_schema=pg_cfg.get("schema")
+        sqls=[]
+        max_rows_per_file=config.get("export", {}).get("row_grouping",{}).get("max_rows_per_file",{})
+        # All column and PK metadata in two round-trips instead of two per table.
+        table_names=[config.get("tables", {})[t][0].get("name") for t in config.get("tables", {}).keys()]
+        all_columns=get_all_table_columns(pg_conn,table_schema,table_names)
+        all_pks=get_all_table_pks(pg_conn,table_schema,table_names)
+        tables_meta: Dict[str, TableMeta] = {}
+        for table in config.get("tables", {}).keys():
+            table_cfg=config.get("tables", {})[table][0]
+            table_name=table_cfg.get("name")
+            print(f"{sf_creds.database}.{sf_creds.schema}.{table_name}_RAW")
+            base_query, base_has_where = build_base_query(table_cfg, table_schema, all_columns.get(table_name, []))
+            meta=TableMeta(
+                columns=all_columns.get(table_name, []),
+                pk=all_pks.get(table_name),
+                rowcount=estimate_rowcount(pg_conn,f'SELECT * FROM {table_schema}.{table_name}'),
+                base_query=base_query,
+                has_where=base_has_where,
+                partition_spec=table_cfg.get("partition"),
+            )
+            tables_meta[table_name]=meta
+
+            if meta.partition_spec is not None:
+                sqls=apply_partition_clause(meta.base_query,meta.partition_spec,meta.has_where)
+
+                # Stage every partition chunk under one prefix, then one COPY INTO
+                # for the whole table instead of a COPY round-trip per chunk.
+                # Partition windows are independent, so fan the extract+PUT out
+                # across processes: Postgres reads, gzip, and uploads for several
+                # chunks run concurrently instead of back to back.
+                stage_subdir=table_name.lower()
+                chunk=plan_file_splits(meta.rowcount, max_rows_per_file)
+                chunk_sqls=[build_chunk_query(sql,table_cfg['order_by'],chunk[0]) for sql in sqls]
+                rows_staged=0
+                with ProcessPoolExecutor(max_workers=min(8, len(chunk_sqls))) as pool:
+                    futures=[
+                        pool.submit(
+                            _stage_one_chunk, pg_creds, sf_creds, data_dir, chunk_sql_query,
+                            f"@{sf_creds.database}.{sf_creds.schema}.{sf_creds.sf_landing_stage}",
+                            f"{sf_creds.database}.{sf_creds.schema}.CSV_FMT",
+                            f"{sf_creds.database}.{sf_creds.schema}.{table_name}_RAW",
+                            stage_subdir,
+                        )
+                        for chunk_sql_query in chunk_sqls
+                    ]
+                    for fut in as_completed(futures):
+                        rows_staged+=fut.result()
+
+                if rows_staged>0:
+                    copy_stage_prefix_into_table(
+                        sf_creds,
+                        f"@{sf_creds.database}.{sf_creds.schema}.{sf_creds.sf_landing_stage}/pg_extract/{stage_subdir}",
+                        f"{sf_creds.database}.{sf_creds.schema}.CSV_FMT",
+                        f"{sf_creds.database}.{sf_creds.schema}.{table_name}_RAW",
+                        meta.columns,
+                        sf_conn=sf_conn,
+                    )
+
+            else:
+                chunks=plan_file_splits(meta.rowcount, max_rows_per_file)
+                # One boundary-key scan up front lets every chunk after the first
+                # seek straight to its start row (keyset pagination) instead of
+                # OFFSET-scanning and discarding the rows before it.
+                boundary_keys=(
+                    fetch_chunk_boundary_keys(pg_conn,meta.base_query,table_cfg['order_by'],max_rows_per_file)
+                    if len(chunks)>1 else []
+                )
+                last_key=None
+                for i,chunk in enumerate(chunks):
+                    if i>0 and last_key is None:
+                        # The padded rowcount estimate planned more chunks than
+                        # the data has: everything past the final boundary already
+                        # fit inside the previous chunk's LIMIT.
+                        break
+                    chunk_sql_query=build_chunk_query(meta.base_query,table_cfg['order_by'],chunk,
+                                                      last_key=last_key,has_where=meta.has_where)
+                    postgres_query_to_snowflake_table( pg_creds,sf_creds,data_dir,chunk_sql_query,
+                                                      f"@{sf_creds.database}.{sf_creds.schema}.{sf_creds.sf_landing_stage}",
+                                                      f"{sf_creds.database}.{sf_creds.schema}.CSV_FMT",
+                                                      f"{sf_creds.database}.{sf_creds.schema}.{table_name}_RAW",
+                                                      overwrite_table=(i==0),
+                                                      sf_conn=sf_conn)
+                    last_key=boundary_keys[i] if i<len(boundary_keys) else None
+
+    finally:
+        # Close in a finally so an exception mid-loop doesn't leak the
+        # long-lived session, matching the per-call cleanup in
+        # postgres_query_to_snowflake_table / copy_stage_prefix_into_table.
+        sf_conn.close()
 
 
 if __name__=="__main__":main()